@@ -2,8 +2,8 @@ import logging as log
 import numpy
 from pathlib import Path
 from utils.grid import Grid
+from utils.file_io import write_bytes, write_table, get_columns, read_table, split_columns
 import os
-import csv
 import shutil
 
 
@@ -14,6 +14,9 @@ class AbaqusEngine:
     used operation system (linux/windows), the numbers of CPUs or if a user subroutine should be used..
     """
 
+    # Files needed by Abaqus to restart an analysis. They are only read by the restart, see .copy_previous_result_files()
+    _restart_file_suffixes = ('.res', '.mdl', '.stt', '.prt', '.odb', '.sim', '.abq', '.pac', '.sel')
+
     def __init__(self, input_file):
         """
         Args:
@@ -48,6 +51,15 @@ class AbaqusEngine:
         self.node_set = {}
         self.paths = {'output': Path(), 'scratch': Path()}
 
+        # The input file is not modified during a run, therefore parts and instances are only searched once.
+        self._part_names = None
+        self._instance_names = None
+        # Node set names and instance the node sets were created from per set_work_name, see
+        # .create_node_set_all_list()
+        self._node_set_sources = {}
+        # Invariant text parts of the input file per set_work_name, see ._get_input_file_template()
+        self._input_file_templates = {}
+
     def __str__(self):
         return self.input_file.name
 
@@ -58,8 +70,10 @@ class AbaqusEngine:
             List of parts
         """
 
-        parts = [line[12:] for line in self.data if '*Part, name=' in line]
-        return parts
+        if self._part_names is None:
+            self._part_names = [line[12:] for line in self.data if '*Part, name=' in line]
+
+        return self._part_names
 
     def get_instance_names(self):
         """ Searches the input file for all instances assembled from parts. A dictionary containing the instance name
@@ -69,15 +83,18 @@ class AbaqusEngine:
 
         """
 
-        instances = {}
-        instances_arr = [line.split(', ')[1:3] for line in self.data if '*Instance, name=' in line]
+        if self._instance_names is None:
+            instances = {}
+            instances_arr = [line.split(', ')[1:3] for line in self.data if '*Instance, name=' in line]
 
-        for arr in instances_arr:
-            key = arr[0][5:]
-            value = arr[1][5:]
-            instances[key] = value
+            for arr in instances_arr:
+                key = arr[0][5:]
+                value = arr[1][5:]
+                instances[key] = value
 
-        return instances
+            self._instance_names = instances
+
+        return self._instance_names
 
     def get_nodes(self, object_name):
         """ Function to create an listing consisting of dictionary for each found node, containing node number and
@@ -89,8 +106,8 @@ class AbaqusEngine:
             object_name (String): Name of the part/assembly
 
         Returns:
-            dict: Containing nodes and corresponding coordinates for each node in part_name {x_coordinate, y_coordinate,
-             z_coordinate, node_number}
+            dict: Containing nodes and corresponding coordinates for all nodes in part_name column wise, means one
+             array per key {node_number, x_coordinate, y_coordinate, z_coordinate}
         """
 
         try:
@@ -105,62 +122,62 @@ class AbaqusEngine:
             # Variable set to True when node information have been found.
             read_coordinates = False
 
-            # Initialize empty list for collecting dictionaries.
-            node_list = []
+            # Initialize empty list for collecting the parsed lines.
+            node_lines = []
 
             # Check each line of input file
             for line in self.data:
-                line_string = line.strip().lower()
-
-                # If read_coordinates is True and *Element was found in the actual line, the listing of
-                # coordinates ended.
-                if '*Element,' in line:
-                    if read_coordinates:
-                        self.log.debug('Found end of part/assembly.')
-                        break
-
-                # True if the coordinates are stored in a part.
-                if part_string == line_string:
-                    self.log.info(f'Found nodes in parts at "{line_string}". Start reading coordinates of nodes '
-                                  f'for this part.')
-                    read_coordinates = True
-                    continue
-
-                # True if the coordinates are stored in the assembly.
-                if assembly_string == line_string[:assembly_string.__len__()]:
-                    self.log.info(f'Found nodes in assembly at "{line_string}". Start reading coordinates '
-                                  f'of nodes for this part.')
-                    read_coordinates = True
+                # Keywords (e.g. *Node, *Element) and comments are the only lines containing a '*'. As they are rare
+                # compared to the lines containing coordinates, only these lines are normalized and compared to the
+                # search strings. All other lines are not copied at all.
+                if '*' in line:
+                    line_string = line.strip().lower()
+
+                    # If read_coordinates is True and *Element was found in the actual line, the listing of
+                    # coordinates ended.
+                    if line_string.startswith('*element,'):
+                        if read_coordinates:
+                            self.log.debug('Found end of part/assembly.')
+                            break
+
+                    # True if the coordinates are stored in a part.
+                    elif part_string == line_string:
+                        self.log.info(f'Found nodes in parts at "{line_string}". Start reading coordinates of nodes '
+                                      f'for this part.')
+                        read_coordinates = True
+
+                    # True if the coordinates are stored in the assembly.
+                    elif line_string.startswith(assembly_string):
+                        self.log.info(f'Found nodes in assembly at "{line_string}". Start reading coordinates '
+                                      f'of nodes for this part.')
+                        read_coordinates = True
+
+                    # Keywords and comments are no coordinates and are skipped without parsing.
                     continue
 
-                # If beginning of coordination listing is found, the coordinates are going to be extracted from
-                # each line and appended into an earlier initialized array. It must be checked if the line contains
-                # x/y/z or only x/y coordinates.
+                # If beginning of coordination listing is found, the lines containing the coordinates are collected
+                # and parsed all at once after the listing ended.
                 if read_coordinates:
-                    try:
-                        line_array = numpy.fromstring(line, dtype=float, sep=',')
+                    # Skip empty lines
+                    if not line or line.isspace():
+                        continue
 
-                        node = line_array[0]
-                        x = line_array[1]
-                        y = line_array[2]
-                        z = 0
+                    node_lines.append(line)
 
-                        if len(line_array) == 4:
-                            z = line_array[3]
+            node_array = self._parse_node_lines(node_lines) if node_lines else numpy.empty((0, 4))
 
-                        node_dict = {'node_number': int(node), 'x_coordinate': float(x), 'y_coordinate': float(y),
-                                     'z_coordinate': float(z)}
+            self.log.info('Added %s nodes with x/y/z-coordinates', len(node_array))
 
-                        node_list.append(node_dict)
+            if not len(node_array) == 0:
+                # The nodes are stored column wise (structure of arrays) with one contiguous array per key instead of
+                # one dictionary per node. The transposed copy is the only copy of the parsed values, the coordinates
+                # are handed out as views of it. Listings without z-coordinate get z=0.
+                node_array = numpy.ascontiguousarray(node_array.T)
 
-                    except Exception as err:
-                        self.log.warning(f'An error occurred while reading coordinates for nodes in line '
-                                         f'{line_string}. Error: {str(err)}')
-
-            self.log.info('Added %s nodes with x/y/z-coordinates', len(node_list))
-
-            if not len(node_list) == 0:
-                return node_list
+                return {'node_number': node_array[0].astype(numpy.int64),
+                        'x_coordinate': node_array[1],
+                        'y_coordinate': node_array[2],
+                        'z_coordinate': node_array[3] if len(node_array) == 4 else numpy.zeros(node_array.shape[1])}
 
             else:
                 self.log.error('No nodes found for part: %s. Abort!', object_name)
@@ -170,6 +187,60 @@ class AbaqusEngine:
             self.log.error(str(err))
             return 0
 
+    def _parse_node_lines(self, node_lines):
+        """ Parse the lines of a node listing. Each valid line consists of the node number and two or three
+        coordinates. All lines are handed to numpy.loadtxt() at once, only if the listing is not a uniform table the
+        lines are parsed one by one, invalid lines are skipped and lines without z-coordinate get z=0.
+
+        Args:
+            node_lines (list): lines of the node listing
+
+        Returns:
+            ndarray: parsed nodes of shape (nodes, 3) for listings without z-coordinate, otherwise (nodes, 4)
+        """
+        try:
+            node_array = numpy.loadtxt(node_lines, dtype=float, delimiter=',', ndmin=2, comments=None)
+
+            if node_array.shape[1] not in (3, 4):
+                raise ValueError(f'Expected 3 or 4 entries per line, found {node_array.shape[1]}.')
+
+        except ValueError as err:
+            self.log.debug(f'Node listing is not a uniform table, parse line by line. [{err}]')
+
+            parsed_lines = []
+
+            # Invalid lines are only counted inside the loop and reported once afterwards. The single lines are
+            # only logged if the debug level is enabled.
+            skipped_lines = 0
+            log_lines = self.log.isEnabledFor(log.DEBUG)
+
+            for line in node_lines:
+                try:
+                    line_list = [float(entry) for entry in line.split(',')]
+                except ValueError:
+                    line_list = []
+
+                # A valid line consists of the node number and two or three coordinates
+                if not (len(line_list) == 3 or len(line_list) == 4):
+                    skipped_lines += 1
+                    if log_lines:
+                        self.log.debug('Expected 3 or 4 entries, found %s in line %s.', len(line_list), line.strip())
+                    continue
+
+                # Lines without z-coordinate get z=0
+                if len(line_list) == 3:
+                    line_list.append(0.)
+
+                parsed_lines.append(line_list)
+
+            if skipped_lines:
+                self.log.warning('An error occurred while reading coordinates for nodes. %s lines skipped, expected '
+                                 '3 or 4 entries per line.', skipped_lines)
+
+            node_array = numpy.array(parsed_lines, dtype=float).reshape(-1, 4)
+
+        return node_array
+
     def create_node_set_all_list(self, set_work_name, instance_name):
         """ Function to create a dictionary consisting of all node number and abaqus node set combinations. An entry
             of the the dictionary looks, due to instance_name = 'Part-1', for example like this:
@@ -197,16 +268,27 @@ class AbaqusEngine:
             self.log.error(f'Set_work_name {set_work_name} not found in {self.node_set.keys()}')
             return 0
 
-        node_set_dict = {}
+        # The node sets only change with the node set names or the instance. If both are unchanged, the existing node
+        # sets are kept, so the cached text of the input file can be reused as well (see ._get_input_file_template()).
+        source = self._node_set_sources.get(set_work_name)
+        if source is not None and source[0] is node_set_names_dict and source[1] == instance_name \
+                and 'sets' in self.node_set[set_work_name]:
+            self.log.debug(f'Node sets in .node_set[{set_work_name}][sets] are up to date')
+            return self.node_set[set_work_name]['sets']
 
         try:
             # Every node gets its own node set as shown below:
             # *Nset, nset = node-234, internal, instance = Part-1
             # 234
+            # The constant part is formatted once, per node only the name and the node number are put together. This is
+            # faster than numpy.char.add(), which loops over the elements as well but creates fixed width copies of the
+            # strings for each operation and converts them back to str afterwards.
+            instance_text = f', instance={instance_name}\n'
+
+            node_set_dict = {node_number: f'*Nset, nset={name}{instance_text}{node_number},'
+                             for node_number, name in node_set_names_dict.items()}
 
-            for node, name in node_set_names_dict.items():
-                nset_string = '*Nset, nset=' + name + ', instance=' + instance_name + '\n' + str(node) + ','
-                node_set_dict[int(node)] = nset_string
+            self._node_set_sources[set_work_name] = (node_set_names_dict, instance_name)
 
             self.node_set[set_work_name]['sets'] = node_set_dict
             self.log.debug(f'Node sets created and stored successfully in .node_set[{set_work_name}][sets]')
@@ -237,10 +319,37 @@ class AbaqusEngine:
         """
         self.log.info(f'Copying files from previous iteration "{prev_job_folder}" to current iterations output '
                       f'folder "{current_job_folder}".')
-        shutil.copytree(prev_job_folder, current_job_folder, dirs_exist_ok=True)
+        # The restart files are hard linked instead of copied, as they are only read by Abaqus and removed afterwards
+        # anyway. All other files are copied, as they may be written again in the new folder.
+        shutil.copytree(prev_job_folder, current_job_folder, copy_function=self._link_or_copy, dirs_exist_ok=True)
 
         return True
 
+    @classmethod
+    def _link_or_copy(cls, source, destination):
+        """ Copy function for shutil.copytree(). Restart files of Abaqus (see ._restart_file_suffixes) are hard linked,
+        so no data has to be copied. A hard link shares its content with the file of the previous step, therefore all
+        other files, which may be overwritten in the new step, are copied. If linking is not possible (e.g. different
+        drives, unsupported file system or an existing destination), the file is copied as well.
+
+        Args:
+            source: path of the file to be copied
+            destination: path of the new file
+
+        Returns:
+            destination
+        """
+        if Path(source).suffix.lower() in cls._restart_file_suffixes:
+            try:
+                os.link(source, destination)
+                return destination
+            except OSError:
+                pass
+
+        shutil.copy2(source, destination)
+
+        return destination
+
     def clean_previous_files(self, step_name, current_job_folder):
         """ After a successful iteration step, which is not the initial step, the files of the previous simulation are
         deleted from the current simulation. See .copy_previous_results_files().
@@ -256,12 +365,12 @@ class AbaqusEngine:
         # Current folder is looped and every file consisting of the previous job name will be deleted
         self.log.info(f'Removing files of previous simulation ({step_name})from '
                       f'current sub folder: {current_job_folder}')
-        for dir_name, dir_names, file_names in os.walk(current_job_folder):
-            for filename in file_names:
-                if step_name in filename:
-                    Path(current_job_folder / filename).unlink()
-                    # os.remove(current_job_folder + '/' + filename)
-                    self.log.debug('File removed: %s', filename)
+        # Only the files in the folder itself are checked, sub folders are not entered.
+        with os.scandir(current_job_folder) as entries:
+            for entry in entries:
+                if step_name in entry.name and entry.is_file():
+                    os.remove(entry.path)
+                    self.log.debug('File removed: %s', entry.name)
 
         return True
 
@@ -280,16 +389,19 @@ class AbaqusEngine:
 
         if isinstance(grid, Grid):
             try:
-                node_set_names_dict = {}
-
-                # Every node gets its own node set like: node-234
-                for node_number in grid.nodes.keys():
-                    node_set = 'node-' + str(node_number)
-                    node_set_names_dict[node_number] = node_set
-
                 if set_work_name not in self.node_set:
                     self.node_set[set_work_name] = {}
 
+                # The node numbers of a grid do not change between the iterations. If the names exist already for the
+                # same nodes, they are kept, so the node sets depending on them do not need to be created again.
+                node_set_names_dict = self.node_set[set_work_name].get('set_names')
+                if node_set_names_dict is not None and node_set_names_dict.keys() == grid.nodes.keys():
+                    self.log.debug(f'Node set names in .node_set[{set_work_name}][set_names] are up to date')
+                    return node_set_names_dict
+
+                # Every node gets its own node set like: node-234
+                node_set_names_dict = {node_number: f'node-{node_number}' for node_number in grid.nodes.keys()}
+
                 self.node_set[set_work_name]['set_names'] = node_set_names_dict
                 self.log.debug(f'Node set names created and saved successfully in .node_set'
                                f'[{set_work_name}][set_names]')
@@ -346,21 +458,21 @@ class AbaqusEngine:
         if bc_2_name == 0:
             bc_2_name = bc_1_name
 
-        bc_dict = {}
-
         # Check if length of all node_numbers given in node_values_dict have a corresponding node sets
-        for node_number in node_values_dict:
-            if node_number not in node_set_names_dict.keys():
-                self.log.error(f'Node {node_number} not found in node sets in .node_set[{set_work_name}][set_names]')
-                raise KeyError
+        missing_nodes = node_values_dict.keys() - node_set_names_dict.keys()
+        if missing_nodes:
+            self.log.error(f'Node {next(iter(missing_nodes))} not found in node sets in '
+                           f'.node_set[{set_work_name}][set_names]')
+            raise KeyError
 
         try:
             # Every node gets its own boundary condition as shown below:
             # node-1, 8, 8, 123456
-            for node_number, value in node_values_dict.items():
+            # The constant part is formatted once, per node only the name and the value are put together.
+            bc_names = f', {bc_1_name}, {bc_2_name}, '
 
-                bc_str = f'{node_set_names_dict[node_number]}, {bc_1_name}, {bc_2_name}, {value}'
-                bc_dict[node_number] = bc_str
+            bc_dict = {node_number: f'{node_set_names_dict[node_number]}{bc_names}{value}'
+                       for node_number, value in node_values_dict.items()}
 
             self.log.debug(f'Boundary conditions created and stored successfully in .node_set[{set_work_name}]'
                            f'[boundary_conditions].')
@@ -402,6 +514,53 @@ class AbaqusEngine:
         try:
             input_file = path / f'{job_name}.inp'
 
+            # Only the boundary conditions change between the iterations. They are put between the invariant parts of
+            # the input file.
+            bc_text = ('**Boundary conditions created by Python \n'
+                       '*Boundary \n'
+                       + self._join_boundary_conditions(bc_dict))
+
+            input_file.write_text(bc_text.join(self._get_input_file_template(set_work_name, node_sets_dict)))
+            self.log.info(f'Abaqus input file created successfully and saved at {input_file}')
+
+            return input_file
+
+        except Exception as err:
+            self.log.error(str(err))
+            return 0
+
+    @staticmethod
+    def _join_boundary_conditions(bc_dict: dict):
+        """ Join the boundary conditions created by .create_boundary_condition() to the text of the input file, one
+        line each. The lines are joined by one call, instead of formatting each line separately.
+
+        Args:
+            bc_dict (dict): boundary conditions {node_number: boundary condition line}
+
+        Returns:
+            str: lines of the boundary conditions
+        """
+        if not bc_dict:
+            return ''
+
+        return ' \n'.join(bc_dict.values()) + ' \n'
+
+    def _get_input_file_template(self, set_work_name: str, node_sets_dict: dict):
+        """ The input file and the node sets do not change between the iterations. Therefore the text of the input
+        file, including the node sets, is only assembled once per node set dictionary. Each placeholder for boundary
+        conditions splits the text into two parts.
+
+        Args:
+            set_work_name (str): Name of the set in instance
+            node_sets_dict (dict): node sets to be written into the input file, see .create_node_set_all_list()
+
+        Returns:
+            list of text parts to be joined by the boundary conditions
+        """
+        template = self._input_file_templates.get(set_work_name)
+
+        if template is None or template[0] is not node_sets_dict:
+            parts = []
             input_file_text = []
 
             for line in self.data:
@@ -412,22 +571,18 @@ class AbaqusEngine:
                         input_file_text.append(f'{node_set} \n')
 
                 elif '** bc_python_fill_in_placeholder' in line:
-                    input_file_text.append('**Boundary conditions created by Python \n')
-                    input_file_text.append('*Boundary \n')
-                    for bc in bc_dict.values():
-                        input_file_text.append(f'{bc} \n')
+                    parts.append(''.join(input_file_text))
+                    input_file_text = []
 
                 else:
                     input_file_text.append(f'{line} \n')
 
-            input_file.write_text(''.join(map(str, input_file_text)))
-            self.log.info(f'Abaqus input file created successfully and saved at {input_file}')
+            parts.append(''.join(input_file_text))
 
-            return input_file
+            template = (node_sets_dict, parts)
+            self._input_file_templates[set_work_name] = template
 
-        except Exception as err:
-            self.log.error(str(err))
-            return 0
+        return template[1]
 
     def write_input_file_restart(self, set_work_name: str, job_name: str, path, previous_input_file: str,
                                  step_name: str, restart_step: str,
@@ -514,8 +669,7 @@ class AbaqusEngine:
 
             input_file_text.append(f'**Boundary conditions created by Python \n')
             input_file_text.append(f'*Boundary \n')
-            for bc in bc_dict.values():
-                input_file_text.append(f'{bc} \n')
+            input_file_text.append(self._join_boundary_conditions(bc_dict))
 
             self.log.debug('Step: Adding output request')
             input_file_text.append(f'** \n')
@@ -624,34 +778,36 @@ class AbaqusEngine:
                 job_name = input_file.name[:-len(input_file.suffix)]
                 bash_file = path / f'{job_name}.bat'
 
-                # Create the command line for the bash file according to given function input parameters.
-                cmd_string = f'call abaqus job="{job_name}" input="{input_file}"'
+                # Create the command line for the bash file according to given function input parameters. The
+                # parts are collected in a list and joined once at the end.
+                cmd_parts = ['call abaqus', f'job="{job_name}"', f'input="{input_file}"']
 
                 # Check if old job parameter is given and add parameter to command line
                 if old_job_name:
-                    cmd_string = f'{cmd_string} oldjob="{old_job_name}"'
+                    cmd_parts.append(f'oldjob="{old_job_name}"')
 
                 # Add user subroutine to command line
                 if user_subroutine_path:
-                    cmd_string = f'{cmd_string} user="{user_subroutine_path}"'
+                    cmd_parts.append(f'user="{user_subroutine_path}"')
 
                 # Check if scratch parameter is given and add parameter to command line
                 if use_scratch_path:
                     if not self.paths['scratch'].is_dir():
                         self.log.error(f'Scratch path must be assigned first via function .set_path("scratch", str)')
                         return False
-                    cmd_string = f'{cmd_string} scratch="{self.paths["scratch"]}"'
+                    cmd_parts.append(f'scratch="{self.paths["scratch"]}"')
 
                 # Add additional parameters to command line
+                cmd_parts.append('interactive')
                 if additional_parameters:
-                    cmd_string = f'{cmd_string} interactive {additional_parameters}'
-                else:
-                    cmd_string = f'{cmd_string} interactive'
+                    cmd_parts.append(additional_parameters)
+
+                cmd_string = ' '.join(cmd_parts)
 
                 self.log.debug(f'Created bash file with following content: \n {cmd_string}')
 
                 # Write bash file
-                bash_file.write_text(cmd_string)
+                write_bytes(bash_file, cmd_string.encode())
 
                 self.log.info(f'Bash file created successfully and saved at {bash_file}')
                 return bash_file
@@ -680,7 +836,8 @@ class AbaqusEngine:
                                                 (default: data:3)
 
                 Returns:
-                    ndarray(dict)
+                    dict: data set column wise, means one array per key {x_coordinate, y_coordinate, z_coordinate,
+                     values: {name: array}}. z_coordinate is missing if z_coord_row=-1.
                 """
 
         if values_row is None:
@@ -691,61 +848,15 @@ class AbaqusEngine:
             return False
 
         try:
-            file = Path(file)
-
-            # TODO Check if row fits to given data
-
-            if not file.is_file():
-                self.log.error(f'File {file} not found.')
-                raise FileNotFoundError
-
             self.log.info(f'Load Pace3D-Mesh-File: {file}')
 
-            with file.open('r') as csv_file:
-                read_csv = csv.reader(csv_file, delimiter=delimiter)
-
-                lines = []
-
-                for row in read_csv:
-                    try:
-                        # Check if actual row has the needed length
-                        if len(row) >= max(x_coord_row, y_coord_row, z_coord_row, max(values_row.values())) + 1:
-                            if z_coord_row != -1:
-                                x_coord = float(row[x_coord_row])
-                                y_coord = float(row[y_coord_row])
-                                z_coord = float(row[z_coord_row])
-                                values = {}
-
-                                for key, item in values_row.items():
-                                    values[key] = float(row[item])
-
-                                lines.append({'x_coordinate': x_coord,
-                                              'y_coordinate': y_coord,
-                                              'z_coordinate': z_coord,
-                                              'values': values
-                                              })
-
-                            else:
-                                x_coord = float(row[x_coord_row])
-                                y_coord = float(row[y_coord_row])
-                                values = {}
-
-                                for key, item in values_row.items():
-                                    values[key] = float(row[item])
-
-                                lines.append({'x_coordinate': x_coord,
-                                              'y_coordinate': y_coord,
-                                              'values': values
-                                              })
-                        else:
-                            self.log.info(f'Empty or to short row found. Continue... [{row.__str__()}]')
+            columns = get_columns(x_coord_row, y_coord_row, z_coord_row, values_row)
 
-                    except Exception as err:
-                        self.log.info(f'Empty row found or transition failed. Continue... [{err}]')
+            table = read_table(file, delimiter, columns, self.log)
 
-                self.log.debug(f'{len(lines)} rows read successfully', )
+            self.log.debug('%s rows read successfully', len(table))
 
-                return lines
+            return split_columns(table, z_coord_row != -1, values_row)
 
         except Exception as err:
             self.log.error(f'File --{file}-- could not be read correctly [{err}]')
@@ -767,14 +878,16 @@ class AbaqusEngine:
 
             file = Path(file)
 
-            if not Path(file.parent[0]).is_dir():
-                self.log.error(f'Path to save file into {file.parent[0]} not found.')
+            if not file.parent.is_dir():
+                self.log.error(f'Path to save file into {file.parent} not found.')
                 raise FileNotFoundError
 
             self.log.info(f'Write Abaqus-data-file: {file}')
 
-            # Writing data to csv-file
-            numpy.savetxt(file, data_array, delimiter=delimiter, fmt='%11.8s')
+            # Writing data to csv-file. The rows are formatted and written in chunks of many rows each.
+            data_array = numpy.asarray(data_array)
+            row_format = delimiter.join(['%11.8s'] * (data_array.shape[1] if data_array.ndim > 1 else 1))
+            write_table(file, data_array, row_format)
 
             return True
 
@@ -1,7 +1,7 @@
 import logging as log
 from pathlib import Path
-import csv
 import numpy
+from utils.file_io import write_table, get_columns, read_table, scan_table, split_columns
 
 
 class Pace3dEngine:
@@ -13,10 +13,11 @@ class Pace3dEngine:
     def read_csv_file(self, file: str, delimiter: str = ' ',
                       x_coord_row: int = 0, y_coord_row: int = 1, z_coord_row: int = 2,
                       values_row=None):
-        """ Function to read an dat-file-export from the Software Pace3D from IDM HS Karlsruhe
+        """ Function to read an dat-file-export from the Software Pace3D from IDM HS Karlsruhe. The whole file is read
+        at once, for very large files see .scan_csv_file().
 
                  Parameters:
-                    file (str): filename including path
+                    file (str): filename including path, binary numpy files (.npy) are loaded directly
                     delimiter (str), optional: delimiter used in ascii file
                     x_coord_row (int), optional: row number for x-coordinate (default: 0)
                     y_coord_row (int), optional: row number for y-coordinate (default: 1)
@@ -25,7 +26,8 @@ class Pace3dEngine:
                                                 (default: data:3)
 
                 Returns:
-                    ndarray(dict)
+                    dict: data set column wise, means one array per key {x_coordinate, y_coordinate, z_coordinate,
+                     values: {name: array}}. z_coordinate is missing if z_coord_row=-1.
                 """
 
         if values_row is None:
@@ -36,97 +38,99 @@ class Pace3dEngine:
             return False
 
         try:
-            file = Path(file)
-
-            # TODO Check if row fits to given data
-
-            if not file.is_file():
-                self.log.error(f'File {file} not found.')
-                raise FileNotFoundError
-
             self.log.info(f'Load Pace3D-Mesh-File: {file}')
 
-            with file.open('r') as csv_file:
-                read_csv = csv.reader(csv_file, delimiter=delimiter)
+            columns = get_columns(x_coord_row, y_coord_row, z_coord_row, values_row)
 
-                lines = []
+            table = read_table(file, delimiter, columns, self.log)
 
-                for row in read_csv:
-                    try:
-                        # Check if actual row has the needed length
-                        if len(row) >= max(x_coord_row, y_coord_row, z_coord_row, max(values_row.values())) + 1:
-                            if z_coord_row != -1:
-                                x_coord = float(row[x_coord_row])
-                                y_coord = float(row[y_coord_row])
-                                z_coord = float(row[z_coord_row])
-                                values = {}
+            self.log.debug('%s rows read successfully', len(table))
 
-                                for key, item in values_row.items():
-                                    values[key] = float(row[item])
+            return split_columns(table, z_coord_row != -1, values_row)
 
-                                lines.append({'x_coordinate': x_coord,
-                                              'y_coordinate': y_coord,
-                                              'z_coordinate': z_coord,
-                                              'values': values
-                                              })
+        except Exception as err:
+            self.log.error(f'File --{file}-- could not be read correctly [{err}]')
+            return 0
 
-                            else:
-                                x_coord = float(row[x_coord_row])
-                                y_coord = float(row[y_coord_row])
-                                values = {}
+    def scan_csv_file(self, file: str, delimiter: str = ' ',
+                      x_coord_row: int = 0, y_coord_row: int = 1, z_coord_row: int = 2,
+                      values_row=None, chunk_size: int = 100000):
+        """ Lazy variant of .read_csv_file(). The dat-file-export from the Software Pace3D is read in chunks of
+        chunk_size lines, which are handed over one after another. Therefore very large files can be processed chunk
+        by chunk without keeping the whole file in memory.
+
+                 Parameters:
+                    file (str): filename including path
+                    delimiter (str), optional: delimiter used in ascii file
+                    x_coord_row (int), optional: row number for x-coordinate (default: 0)
+                    y_coord_row (int), optional: row number for y-coordinate (default: 1)
+                    z_coord_row (int), optional: row number for z-coordinate (default: 2)
+                    values_row (int), optional:  dictionary containing data set name and row number for values
+                                                (default: data:3)
+                    chunk_size (int), optional: maximum number of lines per chunk (default: 100000)
 
-                                for key, item in values_row.items():
-                                    values[key] = float(row[item])
+                Returns:
+                    generator: rows of one chunk after another column wise as dict, see .read_csv_file()
+                """
 
-                                lines.append({'x_coordinate': x_coord,
-                                              'y_coordinate': y_coord,
-                                              'values': values
-                                              })
-                        else:
-                            self.log.info(f'Empty or to short row found. Continue... [{row.__str__()}]')
+        if values_row is None:
+            values_row = {'data': 3}
 
-                    except Exception as err:
-                        self.log.info(f'Empty row found or transition failed. Continue... [{err}]')
+        # Check input parameters
+        if not isinstance(values_row, dict):
+            raise TypeError(f'Optional parameter values_row expects dictionary, is {type(values_row)}.')
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(f'Optional parameter chunk_size must be a positive integer, is {chunk_size}.')
 
-                self.log.debug(f'{len(lines)} rows read successfully', )
+        columns = get_columns(x_coord_row, y_coord_row, z_coord_row, values_row)
 
-                return lines
+        # The file and delimiter are checked by scan_table() right away, the file is read while iterating
+        tables = scan_table(file, delimiter, columns, chunk_size, self.log)
 
-        except Exception as err:
-            self.log.error(f'File --{file}-- could not be read correctly [{err}]')
-            return 0
+        return (split_columns(table, z_coord_row != -1, values_row) for table in tables)
 
-    def write_csv_file(self, data_array, file, delimiter: str = ' '):
+    def write_csv_file(self, data_array, file, delimiter: str = ' ', fmt: str = None, binary: bool = False):
         """ Function to write an csv-file-input from a given ndarray for the Software Pace3D
 
          Parameters:
             data_array (ndarray): data set
             file (str): filename including path
             delimiter (str), optional: delimiter used in ascii file
+            fmt (str), optional: %-format string for one row, e.g. '%i %i %f' (default: %f for each column)
+            binary (bool), optional: write a binary numpy file instead of ascii, e.g. if the file is only read
+                                     by .read_csv_file() again. The filename must end with .npy (default: False)
 
         Returns:
             boolean
         """
 
+        # Check input parameters
+        if binary and Path(file).suffix != '.npy':
+            raise ValueError(f'Binary files must be named *.npy, is {file}.')
+
         try:
             file = Path(file)
 
-            if not Path(file.parents[0]).is_dir():
-                self.log.error(f'Path to save file into {file.parent[0]} not found.')
+            if not file.parent.is_dir():
+                self.log.error(f'Path to save file into {file.parent} not found.')
                 raise NotADirectoryError
 
             if isinstance(data_array, list):
                 data_array = numpy.asarray(data_array)
 
-            self.log.info(f'Write pace3D-data-file: {file}')
+            if binary:
+                self.log.info(f'Write binary pace3D-data-file: {file}')
+                numpy.save(file, numpy.asarray(data_array, dtype=float))
+
+                return True
 
-            fmt = ""
+            self.log.info(f'Write pace3D-data-file: {file}')
 
-            for row in data_array[0]:
-                fmt = f'{fmt} %f'
+            if fmt is None:
+                fmt = ' %f' * numpy.shape(data_array)[1]
 
-            # Writing data to csv-file
-            numpy.savetxt(file, data_array, delimiter=delimiter, fmt=fmt)
+            # Writing data to csv-file. The rows are formatted and written in chunks of many rows each.
+            write_table(file, data_array, fmt)
 
             return True
 
@@ -133,8 +133,7 @@ data = pace3d_handler.engine.read_csv_file(file=pace3d_handler.get_file('pore_pr
                                            values_row={'pore_pressure': 3})
 
 # Pace3D z coordinate in 2d is always 1.0 instead of 0. Setting z coordinate to 0 instead.
-for row in data:
-    row['z_coordinate'] = 0
+data['z_coordinate'][:] = 0
 
 actual_step['pace3d'].grid.initiate_grid(data, 'pore_pressure')
 
@@ -160,8 +159,11 @@ abaqus_handler.engine.create_node_set_all_list('PP', abaqus_part_name)
 # Set initial pore pressure distribution imported from an data file from Pace3D.
 log.debug(f'Setting initial pore pressure distribution by pace3d distribution data.')
 
-# Transform data from Pace3D grid to Simulia Abaqus Mesh
-transformer = GridTransformer()
+# Transform data from Pace3D grid to Simulia Abaqus Mesh. One transformer is used for the whole simulation, the grids
+# of each step are set by .update_grid(). KDTrees and neighbors are reused from the cache of the GridTransformer class
+# as long as the coordinates of the grids do not change. The found neighbors are stored in the cache folder, so following
+# runs of this simulation do not need to search them again. The cache folder is not touched by the output cleanup.
+transformer = GridTransformer(sim.get_root_path() / 'cache')
 transformer.add_grid(actual_step['abaqus'].grid, 'abaqus')
 transformer.add_grid(actual_step['pace3d'].grid, 'pace3d')
 transformer.find_nearest_neighbors('pace3d', 'abaqus', 2)
@@ -212,19 +214,14 @@ pore_pressure_import_grid = Grid()
 pore_pressure_import_grid.initiate_grid(void_ratio_import, 'void_ratio')
 
 # Transform void ratio from imported grid to abaqus engine's grid
-transformer = GridTransformer()
-transformer.add_grid(actual_step['abaqus'].grid, 'abaqus')
 transformer.add_grid(pore_pressure_import_grid, 'import')
 transformer.find_nearest_neighbors('import', 'abaqus', 4)
 transformer.transition('import', 'void_ratio', 'abaqus')
 
-# Transform void ratio to porosity
-data_dict = actual_step['abaqus'].grid.get_node_values('void_ratio')
-
-for key, item in data_dict.items():
-    data_dict[key] = item / (1 + item)
+# Transform void ratio to porosity. The values of all nodes are converted at once as array.
+void_ratio = actual_step['abaqus'].grid.get_value_array('void_ratio')
 
-actual_step['abaqus'].grid.set_node_values('porosity', data_dict)
+actual_step['abaqus'].grid.set_node_values('porosity', void_ratio / (1 + void_ratio))
 
 # #################################################################################
 # Next Iteration
@@ -244,14 +241,14 @@ for x in range(0, number_of_steps):
     pace3d_file_next = f'pore_pressure_0{x + 1}'
 
     # Prepare Transfer
-    # Transfer Abaqus pore pressure results into Pace3D Grid object
-    transformer = GridTransformer()
-    transformer.add_grid(actual_step['abaqus'].grid, 'abaqus')
-    transformer.add_grid(actual_step['pace3d'].grid, 'pace3d')
+    # Transfer Abaqus pore pressure results into Pace3D Grid object. The grids of the new step are copies, therefore
+    # they are updated in the transformer.
+    transformer.update_grid(actual_step['abaqus'].grid, 'abaqus')
+    transformer.update_grid(actual_step['pace3d'].grid, 'pace3d')
     transformer.find_nearest_neighbors('abaqus', 'pace3d', 2)
     transformer.transition('abaqus', 'porosity', 'pace3d')
 
-    data = actual_step['pace3d'].grid.get_list()
+    data = actual_step['pace3d'].grid.get_array()
     pace3d_handler.engine.write_csv_file(data, actual_step['abaqus'].get_path() / 'porosity.dat')
 
     # #################################################################################
@@ -265,8 +262,7 @@ for x in range(0, number_of_steps):
                                                values_row={'pore_pressure': 3})
     # Z-dimension in Pace3D is negative in Abaqus positive. Manipulate z-coordinates by multiplying by -1. Pore
     # pressure is given in bar should be N/m²: multiply by 100000.
-    for row in data:
-        row['z_coordinate'] = 0
+    data['z_coordinate'][:] = 0
 
     actual_step['pace3d'].grid.initiate_grid(data, 'pore_pressure')
 
@@ -274,36 +270,42 @@ for x in range(0, number_of_steps):
     # #################################################################################
     # SIMULIA ABAQUS STUFF
     # Preparing simulation iteration
-    actual_step['abaqus'].create_step_folder(abaqus_handler.get_path('output'))
-    actual_step['abaqus'].set_prefix(f'{sim.name}_{step_name}')
+    abaqus_step = actual_step['abaqus']
+    previous_abaqus_step = previous_step['abaqus']
+
+    abaqus_step.create_step_folder(abaqus_handler.get_path('output'))
+    abaqus_step.set_prefix(f'{sim.name}_{step_name}')
 
-    transformer = GridTransformer()
-    transformer.add_grid(actual_step['abaqus'].grid, 'abaqus')
-    transformer.add_grid(actual_step['pace3d'].grid, 'pace3d')
+    # Path and prefix of the step are used several times below
+    step_path = abaqus_step.get_path()
+    prefix = abaqus_step.get_prefix()
+
+    # The Pace3D grid has been initiated again, therefore it is updated in the transformer
+    transformer.update_grid(actual_step['pace3d'].grid, 'pace3d')
 
     transformer.find_nearest_neighbors('pace3d', 'abaqus', 2)
     transformer.transition('pace3d', 'pore_pressure', 'abaqus')
 
     # Create modified boundary conditions in Abaqus input file. This must be done according to Abaqus manual
     abaqus_handler.engine.create_boundary_condition('PP',
-                                                    actual_step['abaqus'].grid.get_node_values('pore_pressure'),
+                                                    abaqus_step.grid.get_node_values('pore_pressure'),
                                                     8)
 
     # Copy all files into the new directory to restart the previous analysis
     # A restart job is only possible if the files of the previous simulation are in
     # the same folder as the current simulation
-    abaqus_handler.engine.copy_previous_result_files(previous_step['abaqus'].path, actual_step['abaqus'].path)
+    abaqus_handler.engine.copy_previous_result_files(previous_abaqus_step.path, step_path)
 
     # Prepare input and batch file
     abaqus_handler.set_file(f'input_file_{step_name}',
                             abaqus_handler.engine.write_input_file_restart(
                                set_work_name='PP',
-                               job_name=actual_step['abaqus'].get_prefix(),
-                               path=actual_step['abaqus'].get_path(),
+                               job_name=prefix,
+                               path=step_path,
                                previous_input_file=abaqus_handler.get_file(f'input_file_'
-                                                                           f'{previous_step["abaqus"].name}'),
-                               step_name=actual_step['abaqus'].name,
-                               restart_step=previous_step["abaqus"].step_no + 1,
+                                                                           f'{previous_abaqus_step.name}'),
+                               step_name=abaqus_step.name,
+                               restart_step=previous_abaqus_step.step_no + 1,
                                step_time_total=86400,
                                step_time_increment_max=86400,
                                # Set to False if each sim should
@@ -313,7 +315,7 @@ for x in range(0, number_of_steps):
     abaqus_handler.set_file(f'bash_file_{step_name}',
                             abaqus_handler.engine.write_bash_file(
                                 # Path of the actual step output
-                                path=actual_step['abaqus'].get_path(),
+                                path=step_path,
                                 # Path of input file for this step
                                 input_file_path=abaqus_handler.get_file(f'input_file_{step_name}'),
                                 # Path of user subroutine
@@ -321,15 +323,14 @@ for x in range(0, number_of_steps):
                                 # Add any valid abaqus parameter in here
                                 additional_parameters='cpus=2 interactive',
                                 # Name of the old job to resume
-                                old_job_name=previous_step['abaqus'].get_prefix()
+                                old_job_name=previous_abaqus_step.get_prefix()
                             ))
 
-    sim.call_subprocess(abaqus_handler.get_file(f'bash_file_{step_name}'), actual_step['abaqus'].path)
+    sim.call_subprocess(abaqus_handler.get_file(f'bash_file_{step_name}'), step_path)
 
-    sim.engines['abaqus'].engine.clean_previous_files(previous_step['abaqus'].name, actual_step['abaqus'].path)
+    sim.engines['abaqus'].engine.clean_previous_files(previous_abaqus_step.name, step_path)
 
-    abaqus_handler.set_file(f'output_file_{step_name}_void-ratio', actual_step['abaqus'].get_path() /
-                            f'{actual_step["abaqus"].get_prefix()}_void-ratio.csv')
+    abaqus_handler.set_file(f'output_file_{step_name}_void-ratio', step_path / f'{prefix}_void-ratio.csv')
 
     # Read pore pressure from previous ended simulation stored in **_pore-pressure.csv and store those in actual step
     # as grid values. Those can be used to generate randomly lowered pore pressure values.
@@ -343,16 +344,11 @@ for x in range(0, number_of_steps):
     pore_pressure_import_grid.initiate_grid(void_ratio_import, 'void_ratio')
 
     # Transform void ratio from imported grid to abaqus engine's grid
-    transformer = GridTransformer()
-    transformer.add_grid(actual_step['abaqus'].grid, 'abaqus')
-    transformer.add_grid(pore_pressure_import_grid, 'import')
+    transformer.update_grid(pore_pressure_import_grid, 'import')
     transformer.find_nearest_neighbors('import', 'abaqus', 4)
     transformer.transition('import', 'void_ratio', 'abaqus')
 
-    # Transform void ratio to porosity
-    data_dict = actual_step['abaqus'].grid.get_node_values('void_ratio')
-
-    for key, item in data_dict.items():
-        data_dict[key] = item / (1 + item)
+    # Transform void ratio to porosity. The values of all nodes are converted at once as array.
+    void_ratio = abaqus_step.grid.get_value_array('void_ratio')
 
-    actual_step['abaqus'].grid.set_node_values('porosity', data_dict)
+    abaqus_step.grid.set_node_values('porosity', void_ratio / (1 + void_ratio))
@@ -114,11 +114,14 @@ class EnginesHandler:
                 if len(self.iterations) > 1:
                     self.iterations[len(self.iterations) - 2].grid = None
 
-            # If input parameter previous_copy is set a deepcopy of the previous step will be created and only the
-            # name and step_no will be changed.
+            # If input parameter previous_copy is set a copy of the previous step will be created and only the
+            # name and step_no will be changed. Only the grid holds data which might be changed in place, therefore
+            # only the grid is copied (see Grid.copy()) instead of copying the whole step by copy.deepcopy().
             if previous_copy:
                 previous_iteration = self.iterations[len(self.iterations) - 1]
-                current_iteration = copy.deepcopy(previous_iteration)
+                current_iteration = copy.copy(previous_iteration)
+                if previous_iteration.grid is not None:
+                    current_iteration.grid = previous_iteration.grid.copy()
                 self.iterations.append(current_iteration)
 
                 previous_iteration_name = previous_iteration.name
@@ -261,16 +264,9 @@ class EnginesHandler:
         # Check input parameters
         if not isinstance(path_name, str):
             raise TypeError(f'Input parameter path_name must be of type string, is {type(path_name)}.')
-        else:
-            # Check if path_name is part of self.paths
-            path_name_exists = False
-
-            for key in self.paths.keys():
-                if key == path_name:
-                    path_name_exists = True
-
-            if not path_name_exists:
-                raise KeyError(f'Path name does not exist. ({path_name})')
+        # Check if path_name is part of self.paths
+        elif path_name not in self.paths:
+            raise KeyError(f'Path name does not exist. ({path_name})')
 
         return self.paths[path_name]
 
@@ -317,15 +313,8 @@ class EnginesHandler:
         # Check input parameters
         if not isinstance(file_name, str):
             raise TypeError(f'Input parameter file_name must be of type string, is {type(file_name)}.')
-        else:
-            # Check if path_name is part of self.paths
-            file_name_exists = False
-
-            for key in self.files.keys():
-                if key == file_name:
-                    file_name_exists = True
-
-            if not file_name_exists:
-                raise KeyError(f'Path name does not exist. ({file_name})')
+        # Check if file_name is part of self.files
+        elif file_name not in self.files:
+            raise KeyError(f'Path name does not exist. ({file_name})')
 
         return self.files[file_name]
@@ -0,0 +1,375 @@
+import csv
+import itertools
+import logging
+import operator
+import os
+import re
+from pathlib import Path
+import numpy
+
+
+# Tables parsed by read_table(), identified by path, modification time, size, delimiter and columns
+_table_cache = {}
+_table_cache_size = 8
+
+
+def write_bytes(file, data: bytes):
+    """ Write a bytes object to a file using a single file descriptor. The file is created if missing and truncated
+    otherwise. In contrast to Path.write_text() no text layer is involved, the data is handed over to os.write()
+    directly.
+
+    Args:
+        file (str, Path): file to be written
+        data (bytes): content of the file
+
+    Returns:
+        int: number of bytes written
+    """
+    fd = os.open(file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+
+    try:
+        view = memoryview(data)
+        written = 0
+
+        # os.write() may write less bytes than given, therefore continue until everything is written.
+        while written < len(view):
+            written += os.write(fd, view[written:])
+
+        return written
+
+    finally:
+        os.close(fd)
+
+
+def count_lines(file, block_size: int = 1 << 20):
+    """ Count the lines of a file by counting line breaks in binary blocks, without decoding the file or creating a
+    string per line. A last line without line break is counted as well.
+
+    Args:
+        file (str, Path): file to be examined
+        block_size (int, optional): number of bytes read at once (default: 1 MiB)
+
+    Returns:
+        int: number of lines
+    """
+    lines = 0
+    last_block = b''
+
+    with open(file, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            lines += block.count(b'\n')
+            last_block = block
+
+    if last_block and not last_block.endswith(b'\n'):
+        lines += 1
+
+    return lines
+
+
+def format_table(data_array, row_format: str):
+    """ Format a two dimensional array as text, one line per row. All rows are formatted by one single
+    %-operation instead of formatting each row separately like numpy.savetxt() does.
+
+    Args:
+        data_array (ndarray, list): data set, a one dimensional array is treated as a single column
+        row_format (str): %-format string for one row, e.g. '%f,%f,%f'
+
+    Returns:
+        str: formatted text
+    """
+    data_array = numpy.asarray(data_array)
+
+    if data_array.ndim == 1:
+        data_array = data_array.reshape(-1, 1)
+
+    # %s and %r format a value by its str()/repr(), which depends on the numpy data type (e.g. float32). Therefore the
+    # numpy scalars are formatted for these, like numpy.savetxt() does. All other conversions get python numbers, which
+    # are converted faster and give the same text.
+    if re.search(r'%[-+ #0-9.]*[sr]', row_format.replace('%%', '')):
+        values = tuple(data_array.ravel())
+    else:
+        values = tuple(data_array.ravel().tolist())
+
+    return (row_format + '\n') * len(data_array) % values
+
+
+def write_table(file, data_array, row_format: str, chunk_size: int = 65536):
+    """ Write a two dimensional array as text file, one line per row, see format_table(). The rows are formatted and
+    written in chunks of chunk_size rows, so only the text of one chunk is kept in memory in addition to the array.
+
+    Args:
+        file (str, Path): file to be written
+        data_array (ndarray, list): data set, a one dimensional array is treated as a single column
+        row_format (str): %-format string for one row, e.g. '%f,%f,%f'
+        chunk_size (int, optional): maximum number of rows formatted at once (default: 65536)
+
+    Returns:
+        int: number of bytes written
+    """
+    data_array = numpy.asarray(data_array)
+
+    if data_array.ndim == 1:
+        data_array = data_array.reshape(-1, 1)
+
+    written = 0
+
+    with open(file, 'wb') as f:
+        for start in range(0, len(data_array), chunk_size):
+            written += f.write(format_table(data_array[start:start + chunk_size], row_format).encode())
+
+    return written
+
+
+def parse_float_rows(rows, columns, logger=None):
+    """ Convert the given columns of already split rows (e.g. by csv.reader) into a float array. Rows which are too
+    short or contain entries which are no numbers are skipped. All entries are converted by numpy at once, only if
+    this fails the rows are converted one by one to find the invalid ones.
+
+    Args:
+        rows (iterable): rows as lists of strings
+        columns (list): column numbers to be converted
+        logger (Logger, optional): logger for skipped rows on debug level
+
+    Returns:
+        tuple: ndarray of shape (rows, len(columns)) and number of skipped rows
+    """
+    # Everything not depending on the single row is prepared once before the loop. The itemgetter picks all needed
+    # entries of a row with one call, it returns a tuple only for more than one column.
+    required_length = max(columns) + 1
+    get_fields = operator.itemgetter(*columns)
+
+    if len(columns) == 1:
+        get_fields = operator.itemgetter(slice(columns[0], columns[0] + 1))
+    log_rows = logger is not None and logger.isEnabledFor(logging.DEBUG)
+
+    fields = []
+    skipped_rows = 0
+
+    for row in rows:
+        # Check if actual row has the needed length. Rows which are too short are skipped right away.
+        if len(row) < required_length:
+            skipped_rows += 1
+            if log_rows:
+                logger.debug('Empty or to short row found. Continue... [%s]', row)
+            continue
+
+        fields.append(get_fields(row))
+
+    try:
+        table = numpy.array(fields, dtype=float)
+
+    except ValueError:
+        table = []
+
+        for row in fields:
+            try:
+                table.append([float(entry) for entry in row])
+
+            except ValueError as err:
+                skipped_rows += 1
+                if log_rows:
+                    logger.debug('Empty row found or transition failed. Continue... [%s]', err)
+
+        table = numpy.array(table, dtype=float)
+
+    return table.reshape(-1, len(columns)), skipped_rows
+
+
+def split_columns(table, has_z, values_row):
+    """ Split a parsed table with the columns x, y, (z), values into one contiguous array per key.
+
+    Args:
+        table (ndarray): parsed table of shape (rows, columns)
+        has_z (bool): True if the table contains a z-coordinate
+        values_row (dict): data set names and row numbers of the values, in the order of the table
+
+    Returns:
+        dict: data set column wise, means one array per key {x_coordinate, y_coordinate, z_coordinate,
+         values: {name: array}}. z_coordinate is missing if has_z is False.
+    """
+    # The columns are always copied, so the data set can be modified even if the table is shared with the cache of
+    # read_table()
+    table = numpy.array(table.T, order='C')
+
+    data_set = {'x_coordinate': table[0],
+                'y_coordinate': table[1]}
+
+    values_start = 2
+
+    if has_z:
+        data_set['z_coordinate'] = table[2]
+        values_start = 3
+
+    data_set['values'] = {key: table[values_start + i] for i, key in enumerate(values_row)}
+
+    return data_set
+
+
+def get_columns(x_coord_row, y_coord_row, z_coord_row, values_row):
+    """ Columns to be read from a csv file in the order x, y, (z), values. The z-coordinate is optional
+    (z_coord_row=-1).
+
+    Args:
+        x_coord_row (int): row number for x-coordinate
+        y_coord_row (int): row number for y-coordinate
+        z_coord_row (int): row number for z-coordinate, -1 if not available
+        values_row (dict): data set names and row numbers of the values
+
+    Returns:
+        list: column numbers
+    """
+    columns = [x_coord_row, y_coord_row]
+
+    if z_coord_row != -1:
+        columns.append(z_coord_row)
+
+    columns.extend(values_row.values())
+
+    return columns
+
+
+def parse_lines(raw_lines, delimiter, columns, logger=None):
+    """ Parse the given columns of a list of lines into a two dimensional array, one row per valid line.
+
+    The common case of lines consisting only of numbers with a constant number of entries is handed to the C tokenizer
+    of numpy.loadtxt() specialised on the delimiter and the needed columns, so all lines are parsed by one single call.
+    If this fails, e.g. because of too short rows or entries which are not numbers, the lines are parsed row by row
+    and invalid rows are skipped.
+
+    Args:
+        raw_lines (list): lines of the file
+        delimiter (str): delimiter used in ascii file
+        columns (list): column numbers to be read
+        logger (Logger, optional): logger for skipped rows
+
+    Returns:
+        ndarray: parsed values of shape (rows, len(columns))
+    """
+    logger = logger or logging.getLogger(__name__)
+
+    try:
+        return numpy.loadtxt(raw_lines, delimiter=delimiter, usecols=columns, ndmin=2, comments=None)
+    except ValueError:
+        logger.debug('Chunk does not consist of a uniform numeric table. Parse row by row.')
+
+    table, skipped_rows = parse_float_rows(csv.reader(raw_lines, delimiter=delimiter), columns, logger)
+
+    if skipped_rows:
+        logger.info('%s empty, to short or invalid rows skipped.', skipped_rows)
+
+    return table
+
+
+def scan_table(file, delimiter, columns, chunk_size: int = 100000, logger=None):
+    """ Read the given columns of a csv file in chunks of chunk_size lines, see parse_lines(). The arguments are
+    checked when this function is called, the file is read while iterating over the returned generator.
+
+    Args:
+        file (str, Path): filename including path
+        delimiter (str): delimiter used in ascii file
+        columns (list): column numbers to be read
+        chunk_size (int, optional): maximum number of lines per chunk (default: 100000)
+        logger (Logger, optional): logger for skipped rows
+
+    Returns:
+        generator: parsed values of one chunk after another as ndarray of shape (rows, len(columns))
+    """
+    file = Path(file)
+
+    if not file.is_file():
+        raise FileNotFoundError(f'File {file} not found.')
+    if not isinstance(delimiter, str) or len(delimiter) != 1:
+        raise ValueError(f'Delimiter must be a single character, is {delimiter!r}.')
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f'Chunk size must be a positive integer, is {chunk_size}.')
+
+    return _scan_table(file, delimiter, columns, chunk_size, logger)
+
+
+def _scan_table(file, delimiter, columns, chunk_size, logger):
+    """ Generator reading a csv file chunk by chunk, see scan_table(). """
+    with file.open('r') as csv_file:
+        while True:
+            raw_lines = list(itertools.islice(csv_file, chunk_size))
+
+            if not raw_lines:
+                break
+
+            table = parse_lines(raw_lines, delimiter, columns, logger)
+
+            if len(table):
+                yield table
+
+
+def read_table(file, delimiter, columns, logger=None):
+    """ Read the given columns of a whole csv file. The file is handed to numpy.loadtxt() directly, which reads it
+    block by block in C without creating a python string per line. If the file is not a uniform numeric table, it is
+    read chunk by chunk by scan_table() instead, skipping invalid rows. Binary numpy files (.npy) are loaded without
+    parsing.
+
+    Parsed tables are kept in a cache, identified by the path, modification time and size of the file. Therefore
+    files which do not change between the steps of a coupling, e.g. meshes, are parsed only once. The returned table
+    is read-only, as it is shared with the cache.
+
+    Args:
+        file (str, Path): filename including path
+        delimiter (str): delimiter used in ascii file
+        columns (list): column numbers to be read
+        logger (Logger, optional): logger for skipped rows
+
+    Returns:
+        ndarray: parsed values of shape (rows, len(columns))
+    """
+    logger = logger or logging.getLogger(__name__)
+    file = Path(file)
+
+    if not file.is_file():
+        raise FileNotFoundError(f'File {file} not found.')
+
+    # Binary files written with numpy.save() are mapped instead of parsed. If the leading columns are requested, e.g.
+    # for files written by the engines, the mapped file is sliced without copying, so the values are only copied once
+    # by split_columns().
+    if file.suffix == '.npy':
+        table = numpy.load(file, mmap_mode='r')
+
+        if list(columns) == list(range(len(columns))):
+            return table[:, :len(columns)]
+
+        return table[:, columns]
+
+    stat = file.stat()
+    key = (str(file.resolve()), stat.st_mtime_ns, stat.st_size, delimiter, tuple(columns))
+
+    if key in _table_cache:
+        logger.debug('File %s found in cache, parsing skipped.', file)
+        return _table_cache[key]
+
+    table = _load_table(file, delimiter, columns, logger)
+    table.setflags(write=False)
+
+    # The oldest table is removed if the cache is full
+    if len(_table_cache) >= _table_cache_size:
+        del _table_cache[next(iter(_table_cache))]
+
+    _table_cache[key] = table
+
+    return table
+
+
+def _load_table(file, delimiter, columns, logger):
+    """ Parse a csv file without cache, see read_table(). """
+    try:
+        return numpy.loadtxt(file, delimiter=delimiter, usecols=columns, ndmin=2, comments=None)
+    except ValueError:
+        logger.debug('File does not consist of a uniform numeric table. Parse chunk by chunk.')
+
+    # The number of lines is an upper limit for the number of rows. Therefore the output is allocated once and filled
+    # chunk by chunk, only one chunk is kept in memory in addition to the output.
+    table = numpy.empty((count_lines(file), len(columns)))
+    rows = 0
+
+    for chunk in scan_table(file, delimiter, columns, logger=logger):
+        table[rows:rows + len(chunk)] = chunk
+        rows += len(chunk)
+
+    return table[:rows]
@@ -1,4 +1,5 @@
 import logging as log
+import itertools
 import numpy
 from utils.node import Node
 
@@ -60,6 +61,19 @@ class Grid:
     def __str__(self):
         return f'{self.__class__.__name__}: number of nodes={len(self)}'
 
+    def copy(self):
+        """
+        Returns a copy of the grid. Each node is copied by Node.copy(), which is much faster than copying the grid by
+        copy.deepcopy().
+
+        Returns:
+            Grid
+        """
+        grid = Grid()
+        grid.nodes = {node_number: node.copy() for node_number, node in self.nodes.items()}
+
+        return grid
+
     def get_available_values(self):
         """
         Returns a list of available names for values in grid instance.
@@ -128,19 +142,56 @@ class Grid:
             self.log.error('Grid is empty. No nodes found.')
             return False
 
-    def get_coordinates_array(self):
+    def get_coordinates_array(self, dtype=float):
         """
-        Returns a tuple of coordinates
+        Returns an array of coordinates, one row (x, y, z) per node. The coordinates are written into a preallocated
+        array directly instead of collecting a list of tuples first.
+
+        Args:
+            dtype (optional): data type of the array, e.g. numpy.float32 (default: float)
 
         Returns:
-            tuple of coordinates
+            ndarray of coordinates with shape (nodes, 3)
         """
-        coordinates = []
+        # The attributes are read directly instead of calling Node.coordinates for each node. Like there, a missing
+        # z-coordinate is returned as 0.
+        coordinates = numpy.fromiter(itertools.chain.from_iterable((node.x_coordinate, node.y_coordinate,
+                                                                    node.z_coordinate or 0)
+                                                                   for node in self.nodes.values()),
+                                     dtype=dtype, count=3 * len(self.nodes))
 
-        for node in self.nodes.values():
-            coordinates.append(node.coordinates)
+        return coordinates.reshape(-1, 3)
+
+    def get_structured_axes(self):
+        """
+        Check whether the grid is structured, means a regular cartesian grid like the grids of Pace3D. In a structured
+        grid each node lies on a point of the tensor product of three axes and each point is used by exactly one
+        node. The spacing of the axes does not need to be constant.
 
-        return coordinates
+        Returns:
+            tuple: axes (list of three sorted ndarrays x, y, z) and indices (nodes, 3) of the nodes on the axes,
+                False if the grid is not structured
+        """
+        if not len(self.nodes):
+            return False
+
+        coordinates = self.get_coordinates_array()
+        indices = numpy.empty(coordinates.shape, dtype=numpy.int64)
+        axes = []
+
+        for i in range(3):
+            axis, indices[:, i] = numpy.unique(coordinates[:, i], return_inverse=True)
+            axes.append(axis)
+
+        shape = tuple(len(axis) for axis in axes)
+
+        # Each point of the axes must be used by exactly one node
+        if numpy.prod(shape) != len(self.nodes):
+            return False
+        if len(numpy.unique(numpy.ravel_multi_index(indices.T, shape))) != len(self.nodes):
+            return False
+
+        return axes, indices
 
     def get_list(self):
         """
@@ -164,17 +215,45 @@ class Grid:
 
         return data
 
-    def set_node_values(self, value_name: str, node_dict: dict, ):
+    def get_array(self, dtype=float):
         """
-        Saving value-node-combinations from a dictionary to the nodes in the grid.
+        Returns all saved grid data as array, one row per node like .get_list(). The rows are written into a
+        preallocated array directly instead of creating one list per node first. All nodes must hold the same number
+        of values.
 
         Args:
-            node_dict (dict): dictionary consisting of node_number:value combinations
+            dtype (optional): data type of the array (default: float)
+
+        Returns:
+            ndarray with shape (nodes, 3 + values)
+        """
+        columns = 3
+
+        for node in self.nodes.values():
+            columns += len(node.values)
+            break
+
+        data = numpy.fromiter(itertools.chain.from_iterable(itertools.chain(node.coordinates, node.values.values())
+                                                            for node in self.nodes.values()),
+                              dtype=dtype, count=columns * len(self.nodes))
+
+        return data.reshape(-1, columns)
+
+    def set_node_values(self, value_name: str, node_dict, ):
+        """
+        Saving value-node-combinations from a dictionary to the nodes in the grid. Instead of a dictionary an array
+        holding one value per node in the order of the nodes in the grid can be given, see .set_value_array().
+
+        Args:
+            node_dict (dict, ndarray): dictionary consisting of node_number:value combinations or array of values
             value_name (str): name for the value
 
         Returns:
             boolean: true on success
         """
+        if not isinstance(node_dict, dict):
+            return self.set_value_array(value_name, node_dict)
+
         # Check if nodes included in dict fits with grid
         for node_number in node_dict.keys():
             if node_number not in self.nodes.keys():
@@ -220,6 +299,54 @@ class Grid:
             log.error(f'Key {value_name} not found. {err}')
             return 0
 
+    def get_value_array(self, value_name: str, dtype=float):
+        """
+        Column wise counterpart of .get_node_values(). The values of all nodes are returned as one array in the order
+        of the nodes in the grid (see .nodes), without creating a dictionary first. Values which are not numeric are
+        returned as NaN.
+
+        Args:
+            value_name: value of interest, coordinates can be called as well (see Node.get_value())
+            dtype (optional): data type of the array (default: float)
+
+        Returns:
+            ndarray with shape (nodes,)
+        """
+        values = (node.get_value(value_name) for node in self.nodes.values())
+
+        return numpy.fromiter((value if isinstance(value, (int, float)) else numpy.nan for value in values),
+                              dtype=dtype, count=len(self.nodes))
+
+    def set_value_array(self, value_name: str, values, node_numbers=None):
+        """
+        Column wise counterpart of .set_node_values(). The values are stored in the nodes in the order of node_numbers
+        or, if not given, in the order of the nodes in the grid (see .nodes).
+
+        Args:
+            value_name: name for the value
+            values: array or list of values, one per node
+            node_numbers (optional): node numbers the values belong to (default: all nodes of the grid)
+
+        Returns:
+            boolean: true on success
+        """
+        if node_numbers is None:
+            node_numbers = self.nodes.keys()
+
+        if len(values) != len(node_numbers):
+            raise ValueError(f'Number of values ({len(values)}) does not fit the number of nodes '
+                             f'({len(node_numbers)}).')
+
+        if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+
+        nodes = self.nodes
+
+        for node_number, value in zip(node_numbers, values):
+            nodes[node_number].values[value_name] = value
+
+        return True
+
     def add_node(self, node_number, x_coordinate, y_coordinate, z_coordinate=None, values=None):
         """
         Adding a node to the grid. Each node number must be used just once, otherwise an error is thrown.
@@ -303,10 +430,12 @@ class Grid:
     def initiate_grid(self, data_set, value_name=None, clear_first=True):
         """
         Initiate a new grid by transferring a dictionary including x/y/z-direction, values and optional node_number.
-        Existing grid nodes will be removed first.
+        Existing grid nodes will be removed first. The data set is either a list containing one dictionary per node or
+        a single dictionary holding one array per key (column wise), e.g.
+        {'node_number': [1, 2], 'x_coordinate': [0., 1.], 'y_coordinate': [0., 0.], 'values': {'data': [5., 6.]}}.
 
         Args:
-            data_set: dict including grid information
+            data_set: list of dicts or dict of arrays including grid information
             value_name: name of the values
             clear_first: shall the grid be cleared before importing data set?
 
@@ -315,12 +444,15 @@ class Grid:
         """
 
         try:
-            if isinstance(data_set, list):
+            if clear_first and len(self.nodes) > 0 and (isinstance(data_set, list) or isinstance(data_set, dict)):
+                self.log.warning(f'Grid is not empty ({len(self.nodes)}). '
+                                 f'Grid will be vanished for initialization.')
+                self.nodes = {}
 
-                if clear_first and len(self.nodes) > 0:
-                    self.log.warning(f'Grid is not empty ({len(self.nodes)}). '
-                                     f'Grid will be vanished for initialization.')
-                    self.nodes = {}
+            if isinstance(data_set, dict):
+                return self._initiate_grid_from_columns(data_set, value_name)
+
+            if isinstance(data_set, list):
 
                 i = -1
 
@@ -372,6 +504,59 @@ class Grid:
             self.log.error(f'An error occurred while adding nodes to the grid. [{err}]')
             raise Exception
 
+    def _initiate_grid_from_columns(self, data_set: dict, value_name=None):
+        """
+        Adding the nodes of a column wise data set (dict of arrays) to the grid. See .initiate_grid().
+
+        Args:
+            data_set: dict of arrays including grid information
+            value_name: name of the values
+
+        Returns:
+            boolean: true on success
+        """
+
+        for key in ['x_coordinate', 'y_coordinate']:
+            if key not in data_set:
+                self.log.error(f'No {key} found in {list(data_set.keys())}')
+                return False
+
+        # Converting the columns to lists of python types at once, as Node expects int and float.
+        x_coordinates = numpy.asarray(data_set['x_coordinate'], dtype=float).tolist()
+        y_coordinates = numpy.asarray(data_set['y_coordinate'], dtype=float).tolist()
+        count = len(x_coordinates)
+
+        if 'z_coordinate' in data_set:
+            z_coordinates = numpy.asarray(data_set['z_coordinate'], dtype=float).tolist()
+        else:
+            z_coordinates = [None] * count
+
+        if 'node_number' in data_set:
+            node_numbers = numpy.asarray(data_set['node_number'], dtype=numpy.int64).tolist()
+        else:
+            node_numbers = list(range(count))
+
+        values = {}
+
+        if 'value' in data_set:
+            values[value_name if value_name else 'data'] = numpy.asarray(data_set['value'], dtype=float).tolist()
+
+        if 'values' in data_set:
+            if isinstance(data_set['values'], dict):
+                for key, item in data_set['values'].items():
+                    values[key] = numpy.asarray(item, dtype=float).tolist()
+            else:
+                self.log.warning(f'Input dictionary pretends to include a dictionary for values, but '
+                                 f'found {type(data_set["values"])}.')
+
+        for i in range(count):
+            self.add_node(node_numbers[i], x_coordinates[i], y_coordinates[i], z_coordinates[i],
+                          {key: item[i] for key, item in values.items()})
+
+        self.log.info(f'Added {count} nodes to the grid.')
+
+        return True
+
     def coordinates_exist(self, x_coordinate, y_coordinate, z_coordinate=None):
         """
         Checks whether the given coordinates are already assigned to a node. If so, the particular node_number will
@@ -427,14 +612,24 @@ class Grid:
 
         error = 0
 
-        for node_number_a, node_a in self.nodes.items():
-            for node_number_b, node_b in self.nodes.items():
-                if node_number_a == node_number_b:
-                    continue
-                if node_a.coordinates == node_b.coordinates:
-                    log.error(f'Node {node_number_a} and node {node_number_b} are sharing the same'
-                              f' coordinates ({node_a.coordinates})')
-                    error += 1
+        # Instead of comparing each node with every other node, the nodes are sorted by their coordinates. Nodes
+        # sharing the same coordinates are neighbors afterwards.
+        coordinates = self.get_coordinates_array()
+        node_numbers = numpy.fromiter(self.nodes.keys(), dtype=numpy.int64, count=len(self.nodes))
+
+        order = numpy.lexsort(coordinates.T[::-1])
+        coordinates = coordinates[order]
+        node_numbers = node_numbers[order]
+
+        same_as_previous = numpy.all(coordinates[1:] == coordinates[:-1], axis=1)
+        group_starts = numpy.flatnonzero(~numpy.concatenate(([False], same_as_previous)))
+
+        for start, end in zip(group_starts.tolist(), numpy.append(group_starts[1:], len(order)).tolist()):
+            if end - start > 1:
+                log.error(f'Nodes {node_numbers[start:end].tolist()} are sharing the same'
+                          f' coordinates ({tuple(coordinates[start].tolist())})')
+                # Each pair of nodes is counted in both directions
+                error += (end - start) * (end - start - 1)
 
         if not error:
             return 0
@@ -1,9 +1,14 @@
 import logging as log
 from utils.grid import Grid
-from scipy.spatial import KDTree  # nearest neighbor search
+from scipy.spatial import cKDTree  # nearest neighbor search
+from scipy.spatial import Delaunay  # triangulation of unstructured grids
+from scipy.sparse import csr_matrix
+from pathlib import Path
 import numpy
-import matplotlib.pyplot as plt  # visualisation of transformation validation
+import hashlib
+import os
 import sys
+import tempfile
 
 
 class GridTransformer:
@@ -12,9 +17,30 @@ class GridTransformer:
         unpredictable results.
     """
 
-    def __init__(self):
+    # KDTrees and the neighbor mappings found with them are shared between all instances, as usually a new
+    # GridTransformer is created for each step while the coordinates of the grids do not change. They are identified by
+    # checksums of the coordinates and node numbers.
+    _tree_cache = {}
+    _mapping_cache = {}
+    _cache_size = 8
+
+    def __init__(self, cache_path=None):
+        """
+        Args:
+            cache_path (Path/str, optional): folder to store the results of nearest neighbor searches, so they can be
+                reused by following runs of the same simulation (see .find_nearest_neighbors()). Missing folders are
+                created. If not set, the results are only kept in memory.
+        """
         self.log = log.getLogger(self.__class__.__name__)
 
+        if cache_path is not None:
+            if not isinstance(cache_path, str) and not isinstance(cache_path, Path):
+                raise TypeError(f'Input parameter cache_path must be of type string or Path, is {type(cache_path)}.')
+
+            cache_path = Path(cache_path)
+            cache_path.mkdir(parents=True, exist_ok=True)
+
+        self.cache_path = cache_path
         self.grids = {}
         self.transformation = []
 
@@ -55,6 +81,7 @@ class GridTransformer:
 
         self.grids[grid_name] = {}
         self.grids[grid_name]['transform'] = {}
+        self.grids[grid_name]['weights'] = {}
         self.grids[grid_name]['grid'] = grid
 
         self.log.debug(f'Grid added successfully. ({grid_name})')
@@ -62,7 +89,8 @@ class GridTransformer:
 
     def update_grid(self, grid: Grid, grid_name: str):
         """
-            Update a grid in instance. The available grid will be deleted and replaced by the new grid.
+            Update a grid in instance. The available grid will be deleted and replaced by the new grid. Mappings of
+            other grids to the replaced grid are deleted as well, as they refer to the nodes of the old grid.
         Args:
             grid: Grid to be added.
             grid_name: Name of the grid in the instance.
@@ -79,7 +107,12 @@ class GridTransformer:
         if grid_name not in self.grids:
             raise KeyError(f'Grid with name {grid_name} does not exists. Please use .add_grid() instead.')
 
-        del self.grids['grid_name']
+        del self.grids[grid_name]
+
+        for other_grid in self.grids.values():
+            other_grid['transform'].pop(grid_name, None)
+            other_grid['weights'].pop(grid_name, None)
+
         self.log.debug(f'Grid deleted for update. ({grid_name})')
 
         self.add_grid(grid, grid_name)
@@ -97,7 +130,8 @@ class GridTransformer:
         the edges, especially at the corners. In the corners the distance to the neighbors vary very much. The
         parameter distance_max helps with this issue, as one can set a maximum distance between the node and a
         neighbor. The results are stored in the instance and are used by the function .transition() to transfer
-        the data from one grid to another. This saves time, as the fitting of the grids is done only once.
+        the data from one grid to another. This saves time, as the fitting of the grids is done only once. If a
+        cache_path is set for the instance, the neighbors are stored there and reused by following runs.
 
         Args:
             grid_name_1 (str): Name of the first grid (source)
@@ -127,41 +161,32 @@ class GridTransformer:
         if grid_name_2 not in self.grids:
             raise KeyError(f'Grid with name "{grid_name_2}" not found in {self.grids.keys()}')
 
-        self.log.debug(f'Start identifying nearest neighbors in {grid_name_1} for {grid_name_2}: '
-                       f'neighbors={neighbors_quantity}; max distance={distance_max};')
+        self.log.debug('Start identifying nearest neighbors in %s for %s: neighbors=%s; max distance=%s;',
+                       grid_name_1, grid_name_2, neighbors_quantity, distance_max)
 
-        # Transform grids to arrays containing the coordinates to use KDTree
-        grid_1_coordinates = self.grids[grid_name_1]['grid'].get_coordinates_array()
+        # Contiguous float32 arrays (nodes, 3) containing the coordinates to use KDTree. Those are used for the tree
+        # and the queries without any further conversion.
+        grid_1_coordinates, checksum_1 = self._get_coordinates(grid_name_1)
         grid_1_nodes = list(self.grids[grid_name_1]['grid'].nodes.keys())
-        grid_2_coordinates = self.grids[grid_name_2]['grid'].get_coordinates_array()
+        grid_2_coordinates, checksum_2 = self._get_coordinates(grid_name_2)
         grid_2_nodes = list(self.grids[grid_name_2]['grid'].nodes.keys())
 
-        # Numpy is used to get max and min values, because min() and max() deliver wrong values
-        x_min_1 = numpy.amin(a=grid_1_coordinates, axis=0)[0]
-        y_min_1 = numpy.amin(a=grid_1_coordinates, axis=0)[1]
-        z_min_1 = numpy.amin(a=grid_1_coordinates, axis=0)[2]
-
-        x_max_1 = numpy.amax(a=grid_1_coordinates, axis=0)[0]
-        y_max_1 = numpy.amax(a=grid_1_coordinates, axis=0)[1]
-        z_max_1 = numpy.amax(a=grid_1_coordinates, axis=0)[2]
-
-        x_min_2 = numpy.amin(a=grid_2_coordinates, axis=0)[0]
-        y_min_2 = numpy.amin(a=grid_2_coordinates, axis=0)[1]
-        z_min_2 = numpy.amin(a=grid_2_coordinates, axis=0)[2]
+        # Minimum and maximum of all three directions are computed at once for each grid
+        x_min_1, y_min_1, z_min_1 = grid_1_coordinates.min(axis=0).tolist()
+        x_max_1, y_max_1, z_max_1 = grid_1_coordinates.max(axis=0).tolist()
 
-        x_max_2 = numpy.amax(a=grid_2_coordinates, axis=0)[0]
-        y_max_2 = numpy.amax(a=grid_2_coordinates, axis=0)[1]
-        z_max_2 = numpy.amax(a=grid_2_coordinates, axis=0)[2]
+        x_min_2, y_min_2, z_min_2 = grid_2_coordinates.min(axis=0).tolist()
+        x_max_2, y_max_2, z_max_2 = grid_2_coordinates.max(axis=0).tolist()
 
-        self.log.debug(f'Dimensions of {grid_name_1}:')
-        self.log.debug(f'\t (x): {x_min_1} to {x_max_1}')
-        self.log.debug(f'\t (y): {y_min_1} to {y_max_1}')
-        self.log.debug(f'\t (z): {z_min_1} to {z_max_1}')
+        self.log.debug('Dimensions of %s:', grid_name_1)
+        self.log.debug('\t (x): %s to %s', x_min_1, x_max_1)
+        self.log.debug('\t (y): %s to %s', y_min_1, y_max_1)
+        self.log.debug('\t (z): %s to %s', z_min_1, z_max_1)
 
-        self.log.debug(f'Dimensions of {grid_name_2}:')
-        self.log.debug(f'\t (x): {x_min_2} to {x_max_2}')
-        self.log.debug(f'\t (y): {y_min_2} to {y_max_2}')
-        self.log.debug(f'\t (z): {z_min_2} to {z_max_2}')
+        self.log.debug('Dimensions of %s:', grid_name_2)
+        self.log.debug('\t (x): %s to %s', x_min_2, x_max_2)
+        self.log.debug('\t (y): %s to %s', y_min_2, y_max_2)
+        self.log.debug('\t (z): %s to %s', z_min_2, z_max_2)
 
         # Check if grids are overlapping. If not throw an error as unpredictable errors may occur.
         if not (x_min_1 <= x_max_2 and x_max_1 >= x_min_2):
@@ -174,21 +199,559 @@ class GridTransformer:
             self.log.error("Given grids are not overlapping in z direction. This may lead to unpredictable results.")
             raise ValueError("Given grids are not overlapping in z direction. This may lead to unpredictable results.")
 
-        # Check for nearest neighbor
+        # Check for nearest neighbor. Only the values of the grids change from step to step, therefore the neighbors
+        # and weights are taken from the cache if the coordinates, node numbers and parameters did not change. The
+        # cached mapping is shared and must not be modified.
+        mapping_key = (checksum_1, checksum_2, self._checksum(numpy.array(grid_1_nodes)),
+                       self._checksum(numpy.array(grid_2_nodes)), neighbors_quantity, distance_max)
+
+        if mapping_key in self._mapping_cache:
+            self.log.debug('Nearest neighbors found in cache')
+            transform_dict, weights, count_lonely_nodes = self._mapping_cache[mapping_key]
+        else:
+            dist, points = self._get_neighbors(grid_1_coordinates, checksum_1, grid_2_coordinates, checksum_2,
+                                               neighbors_quantity, distance_max)
+
+            transform_dict, count_lonely_nodes = self._get_transform_dict(dist, points, grid_1_nodes, grid_2_nodes,
+                                                                          distance_max, grid_name_2)
+
+            # The weights of the neighbors do not depend on the values, therefore they are computed once here and
+            # used by each call of .transition()
+            indices, weights = self._get_weights(dist, points, distance_max)
+            weights = {'source_nodes': grid_1_nodes,
+                       'indices': indices,
+                       'weights': weights}
+
+            self._add_to_cache(self._mapping_cache, mapping_key, (transform_dict, weights, count_lonely_nodes))
+
+        if count_lonely_nodes > 0:
+            self.log.warning(f'No neighbors found for {count_lonely_nodes} nodes in {grid_name_1} for {grid_name_2} in '
+                             f'a range of {distance_max}.')
+        self.grids[grid_name_2]['transform'][grid_name_1] = transform_dict
+        self.grids[grid_name_2]['weights'][grid_name_1] = weights
+        self.log.info(f'Nearest neighbors in {grid_name_1} found for {grid_name_2}')
+
+        return True
+
+    def find_grid_cells(self, grid_name_1: str, grid_name_2: str):
+        """
+        Alternative to .find_nearest_neighbors() for structured source grids (see Grid.get_structured_axes()), e.g.
+        the regular grids of Pace3D. Instead of searching neighbors, each node of the target grid is located in a cell
+        of the source grid and the values are interpolated linearly between the corners of this cell. Target nodes
+        outside of the source grid get the values of the closest boundary. The results are stored in the instance
+        like the results of .find_nearest_neighbors() and are used by the function .transition().
+
+        Args:
+            grid_name_1 (str): Name of the first grid (source), must be structured
+            grid_name_2 (str): Name of the second grid (target)
+
+        Returns:
+            boolean: true on success
+        """
+
+        # Check input parameters
+        if not isinstance(grid_name_1, str):
+            raise TypeError(f'Input parameter grid_name_1 must be of type string, is {type(grid_name_1)}.')
+        if not isinstance(grid_name_2, str):
+            raise TypeError(f'Input parameter grid_name_2 must be of type string, is {type(grid_name_2)}.')
+
+        # Check if grids exist
+        if grid_name_1 not in self.grids:
+            raise KeyError(f'Grid with name "{grid_name_1}" not found in {self.grids.keys()}')
+
+        if grid_name_2 not in self.grids:
+            raise KeyError(f'Grid with name "{grid_name_2}" not found in {self.grids.keys()}')
+
+        structure = self.grids[grid_name_1]['grid'].get_structured_axes()
+
+        if not structure:
+            raise ValueError(f'Grid {grid_name_1} is not structured. Please use .find_nearest_neighbors() instead.')
+
+        self.log.debug('Start locating the nodes of %s in the cells of %s', grid_name_2, grid_name_1)
+
+        axes, axes_indices = structure
+        grid_1_nodes = list(self.grids[grid_name_1]['grid'].nodes.keys())
+        grid_2_nodes = list(self.grids[grid_name_2]['grid'].nodes.keys())
+        grid_1_coordinates = self.grids[grid_name_1]['grid'].get_coordinates_array()
+        grid_2_coordinates = self.grids[grid_name_2]['grid'].get_coordinates_array()
+
+        indices, weights = self._get_cell_weights(axes, axes_indices, grid_2_coordinates)
+
+        # The corners of the cells are stored as neighbors, so the statistics can be created as usual. Corners without
+        # weight, e.g. in the direction of a single layered axis, are left out.
+        dist = numpy.linalg.norm(grid_1_coordinates[indices] - grid_2_coordinates[:, numpy.newaxis], axis=2)
+        dist[weights == 0] = numpy.inf
+
+        transform_dict, count_lonely_nodes = self._get_transform_dict(dist, indices, grid_1_nodes, grid_2_nodes,
+                                                                      numpy.inf, grid_name_2)
+
+        self.grids[grid_name_2]['transform'][grid_name_1] = transform_dict
+        self.grids[grid_name_2]['weights'][grid_name_1] = {'source_nodes': grid_1_nodes,
+                                                           'indices': indices,
+                                                           'weights': weights}
+        self.log.info(f'Cells in {grid_name_1} found for {grid_name_2}')
+
+        return True
+
+    @staticmethod
+    def _get_cell_weights(axes, axes_indices, coordinates):
+        """
+        Weights of the linear interpolation in the cells of a structured grid. Each coordinate is located on the axes
+        by a binary search, the corners of the cell are used as neighbors.
+
+        Args:
+            axes (list): sorted axes x, y, z of the structured grid, see Grid.get_structured_axes()
+            axes_indices (ndarray): indices (nodes, 3) of the nodes of the structured grid on the axes
+            coordinates (ndarray): coordinates (nodes, 3) to be located in the structured grid
+
+        Returns:
+            tuple: indices (nodes, 8) of the corners in the nodes of the structured grid and the corresponding weights
+        """
+        shape = tuple(len(axis) for axis in axes)
+
+        # Position of each point of the axes in the list of nodes
+        node_table = numpy.empty(shape, dtype=numpy.int64)
+        node_table[tuple(axes_indices.T)] = numpy.arange(len(axes_indices))
+
+        lower = []
+        fraction = []
+
+        for i, axis in enumerate(axes):
+            if len(axis) == 1:
+                # Single layered axis, e.g. z in 2d grids
+                lower.append(numpy.zeros(len(coordinates), dtype=numpy.int64))
+                fraction.append(numpy.zeros(len(coordinates)))
+                continue
+
+            # Index of the lower point of the cell. Coordinates outside of the axis are moved to the boundary.
+            index = numpy.clip(numpy.searchsorted(axis, coordinates[:, i], side='right') - 1, 0, len(axis) - 2)
+            lower.append(index)
+            fraction.append(numpy.clip((coordinates[:, i] - axis[index]) / (axis[index + 1] - axis[index]), 0, 1))
+
+        indices = numpy.empty((len(coordinates), 8), dtype=numpy.int64)
+        weights = numpy.empty((len(coordinates), 8))
+
+        for corner in range(8):
+            offsets = ((corner >> 2) & 1, (corner >> 1) & 1, corner & 1)
+            corner_weights = numpy.ones(len(coordinates))
+            corner_indices = []
+
+            for i in range(3):
+                if offsets[i]:
+                    corner_weights *= fraction[i]
+                    corner_indices.append(numpy.minimum(lower[i] + 1, shape[i] - 1))
+                else:
+                    corner_weights *= 1 - fraction[i]
+                    corner_indices.append(lower[i])
+
+            indices[:, corner] = node_table[tuple(corner_indices)]
+            weights[:, corner] = corner_weights
+
+        return indices, weights
+
+    def find_grid_triangles(self, grid_name_1: str, grid_name_2: str):
+        """
+        Alternative to .find_nearest_neighbors() for unstructured source grids, e.g. the meshes of Abaqus. The source
+        grid is triangulated (Delaunay, triangles in 2d and tetrahedrons in 3d) and each node of the target grid is
+        located in a triangle. The values are interpolated linearly between the corners of this triangle. Axes on which
+        all source nodes have the same coordinate, e.g. z in 2d grids, are left out. Target nodes outside of the source
+        grid get the value of the closest source node. The results are stored in the instance like the results of
+        .find_nearest_neighbors() and are used by the function .transition().
+
+        Args:
+            grid_name_1 (str): Name of the first grid (source)
+            grid_name_2 (str): Name of the second grid (target)
+
+        Returns:
+            boolean: true on success
+        """
+
+        # Check input parameters
+        if not isinstance(grid_name_1, str):
+            raise TypeError(f'Input parameter grid_name_1 must be of type string, is {type(grid_name_1)}.')
+        if not isinstance(grid_name_2, str):
+            raise TypeError(f'Input parameter grid_name_2 must be of type string, is {type(grid_name_2)}.')
+
+        # Check if grids exist
+        if grid_name_1 not in self.grids:
+            raise KeyError(f'Grid with name "{grid_name_1}" not found in {self.grids.keys()}')
+
+        if grid_name_2 not in self.grids:
+            raise KeyError(f'Grid with name "{grid_name_2}" not found in {self.grids.keys()}')
+
+        grid_1_coordinates = self.grids[grid_name_1]['grid'].get_coordinates_array()
+        grid_2_coordinates = self.grids[grid_name_2]['grid'].get_coordinates_array()
+
+        axes = numpy.flatnonzero(numpy.ptp(grid_1_coordinates, axis=0) > 0)
+
+        if len(axes) < 2:
+            raise ValueError(f'Grid {grid_name_1} cannot be triangulated. Please use .find_nearest_neighbors() '
+                             f'instead.')
+
+        self.log.debug('Start locating the nodes of %s in the triangles of %s', grid_name_2, grid_name_1)
+
+        grid_1_nodes = list(self.grids[grid_name_1]['grid'].nodes.keys())
+        grid_2_nodes = list(self.grids[grid_name_2]['grid'].nodes.keys())
+
+        indices, weights = self._get_triangle_weights(grid_1_coordinates[:, axes], grid_2_coordinates[:, axes])
+
+        # Nodes outside of the source grid get the closest source node
+        outside = numpy.isnan(weights[:, 0])
+
+        if outside.any():
+            self.log.debug('%s nodes of %s are outside of %s', numpy.count_nonzero(outside), grid_name_2,
+                           grid_name_1)
+            tree = self._get_tree(*self._get_coordinates(grid_name_1))
+            _, closest = tree.query(grid_2_coordinates[outside], k=1)
+            indices[outside] = closest[:, numpy.newaxis]
+            weights[outside] = 0.
+            weights[outside, 0] = 1.
+
+        # The corners of the triangles are stored as neighbors, so the statistics can be created as usual. Corners
+        # without weight are left out.
+        dist = numpy.linalg.norm(grid_1_coordinates[indices] - grid_2_coordinates[:, numpy.newaxis], axis=2)
+        dist[weights == 0] = numpy.inf
+
+        transform_dict, count_lonely_nodes = self._get_transform_dict(dist, indices, grid_1_nodes, grid_2_nodes,
+                                                                      numpy.inf, grid_name_2)
+
+        self.grids[grid_name_2]['transform'][grid_name_1] = transform_dict
+        self.grids[grid_name_2]['weights'][grid_name_1] = {'source_nodes': grid_1_nodes,
+                                                           'indices': indices,
+                                                           'weights': weights}
+        self.log.info(f'Triangles in {grid_name_1} found for {grid_name_2}')
+
+        return True
+
+    @staticmethod
+    def _get_triangle_weights(source_coordinates, coordinates):
+        """
+        Weights of the linear interpolation in the triangles of a Delaunay triangulation. The weights are the
+        barycentric coordinates of the points in their triangle.
+
+        Args:
+            source_coordinates (ndarray): coordinates (nodes, dimensions) of the grid to be triangulated
+            coordinates (ndarray): coordinates (nodes, dimensions) to be located in the triangulation
+
+        Returns:
+            tuple: indices (nodes, dimensions + 1) of the corners in the source nodes and the corresponding weights,
+                NaN as weights for points outside of the triangulation
+        """
+        triangulation = Delaunay(source_coordinates)
+        dimensions = source_coordinates.shape[1]
+
+        simplices = triangulation.find_simplex(coordinates)
+        inside = simplices >= 0
+
+        indices = numpy.zeros((len(coordinates), dimensions + 1), dtype=numpy.int64)
+        weights = numpy.full((len(coordinates), dimensions + 1), numpy.nan)
+
+        # Barycentric coordinates by the affine transformation stored for each triangle
+        transform = triangulation.transform[simplices[inside]]
+        barycentric = numpy.einsum('ijk,ik->ij', transform[:, :dimensions],
+                                   coordinates[inside] - transform[:, dimensions])
+
+        indices[inside] = triangulation.simplices[simplices[inside]]
+        weights[inside, :dimensions] = barycentric
+        weights[inside, dimensions] = 1 - barycentric.sum(axis=1)
+
+        # Rounding errors at the edges of the triangles
+        numpy.clip(weights, 0, 1, out=weights)
+
+        return indices, weights
+
+    def _get_transform_dict(self, dist, points, source_nodes, target_nodes, distance_max, target_grid_name):
+        """
+        Put the results of a KDTree query into a dictionary, holding a list of neighbors (node number and distance) for
+        each node of the target grid. Neighbors exceeding distance_max are left out, nodes without any neighbor get
+        None.
+
+        Args:
+            dist (ndarray): distances of the neighbors, see cKDTree.query()
+            points (ndarray): indices of the neighbors, see cKDTree.query()
+            source_nodes (list): node numbers of the source grid
+            target_nodes (list): node numbers of the target grid
+            distance_max (float): maximum distance between node and neighbors
+            target_grid_name (str): name of the target grid, used for logging
+
+        Returns:
+            tuple: dictionary of neighbors and number of nodes without neighbors
+        """
+        # Results of a query with only one neighbor are one dimensional
+        dist = numpy.asarray(dist, dtype=float).reshape(len(dist), -1)
+        points = numpy.asarray(points).reshape(len(points), -1)
+
+        # The checks of the distances and the lookup of the node numbers are done for all neighbors at once. Missing
+        # neighbors, if there are less nodes than neighbors requested, have an infinite distance and are left out
+        # as well as neighbors exceeding the maximum distance.
+        found = numpy.isfinite(dist)
+        included = (found & (dist <= distance_max)).tolist()
+        neighbor_nodes = numpy.asarray(source_nodes)[numpy.where(found, points, 0)].tolist()
+
+        self.log.debug(f'Check results from .query and save in dictionary')
+
+        transform_dict = {}
+
+        for node, nodes, distances, mask in zip(target_nodes, neighbor_nodes, dist.tolist(), included):
+            # Nodes without any neighbor according to the maximum distance get None
+            transform_dict[node] = [{'node_number': neighbor, 'distance': distance}
+                                    for neighbor, distance, valid in zip(nodes, distances, mask) if valid] or None
+
+        lonely_nodes = [node for node, neighbors in transform_dict.items() if neighbors is None]
+
+        # Single nodes without neighbors are only logged if the debug level is enabled
+        if lonely_nodes and self.log.isEnabledFor(log.DEBUG):
+            self.log.debug('No neighbor found for nodes %s in %s', lonely_nodes, target_grid_name)
+
+        return transform_dict, len(lonely_nodes)
+
+    @staticmethod
+    def _get_weights(dist, points, distance_max):
+        """
+        Weights of the inverse distance weighting for the results of a KDTree query. Neighbors exceeding distance_max
+        get the weight 0. If a neighbor has the distance 0, its value is used directly, means its weight is 1 and all
+        other weights of the node are 0. The weights of each node are normalized, nodes without any neighbor get NaN as
+        weights.
+
+        Args:
+            dist (ndarray): distances of the neighbors, see cKDTree.query()
+            points (ndarray): indices of the neighbors, see cKDTree.query()
+            distance_max (float): maximum distance between node and neighbors
+
+        Returns:
+            tuple: indices (nodes, neighbors) of the neighbors in the source nodes and the corresponding weights
+        """
+        # Results of a query with only one neighbor are one dimensional
+        dist = numpy.asarray(dist, dtype=float).reshape(len(dist), -1)
+        points = numpy.asarray(points).reshape(len(points), -1)
+
+        # Missing neighbors, if there are less nodes than neighbors requested, have an infinite distance and the number
+        # of nodes as index. They are left out and get a valid index, so that the values can be gathered at once.
+        found = numpy.isfinite(dist)
+        indices = numpy.where(found, points, 0)
+
+        included = found & (dist <= distance_max)
+        exact = included & (dist == 0)
+        has_exact = exact.any(axis=1)
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            weights = numpy.where(included, 1 / dist, 0.)
+
+            # Only the first neighbor with distance 0 is used
+            weights[has_exact] = 0.
+            weights[has_exact, exact[has_exact].argmax(axis=1)] = 1.
+
+            weights /= weights.sum(axis=1, keepdims=True)
+
+        return indices, weights
+
+    @staticmethod
+    def _get_weights_matrix(weights):
+        """
+        Sparse matrix (target nodes, source nodes) of the weights, so the values of all nodes can be transferred by a
+        single matrix product. The matrix is built once and stored with the weights, therefore it is reused by all
+        following transitions and by cached neighbors (see .find_nearest_neighbors()).
+
+        Args:
+            weights (dict): weights of a transformation (source_nodes, indices, weights), see .find_nearest_neighbors()
+
+        Returns:
+            tuple: csr_matrix of the weights and mask of the target nodes without neighbors
+        """
+        if 'matrix' not in weights:
+            # Nodes without neighbors have NaN as weights, neighbors without weight are left out
+            lonely = numpy.isnan(weights['weights']).all(axis=1)
+            included = ~numpy.isnan(weights['weights']) & (weights['weights'] != 0)
+
+            rows = numpy.broadcast_to(numpy.arange(len(weights['weights']))[:, numpy.newaxis], included.shape)
+
+            weights['matrix'] = csr_matrix((weights['weights'][included],
+                                            (rows[included], weights['indices'][included])),
+                                           shape=(len(weights['weights']), len(weights['source_nodes'])))
+            weights['lonely'] = lonely
+
+        return weights['matrix'], weights['lonely']
+
+    def _get_coordinates(self, grid_name):
+        """
+        Coordinates of a grid in the instance as contiguous float32 array (nodes, 3) and their checksum. Both are
+        created once per grid and kept in the instance, e.g. for both directions of .transformation_validation().
+        Changes of the grid's coordinates after adding it are therefore only taken into account after calling
+        .update_grid().
+
+        Args:
+            grid_name (str): Name of the grid
+
+        Returns:
+            tuple: coordinates array and checksum, see ._checksum()
+        """
+        if 'coordinates' not in self.grids[grid_name]:
+            coordinates = self.grids[grid_name]['grid'].get_coordinates_array(numpy.float32)
+            self.grids[grid_name]['coordinates'] = coordinates, self._checksum(coordinates)
+
+        return self.grids[grid_name]['coordinates']
+
+    @staticmethod
+    def _checksum(array):
+        """
+        Checksum of an array, e.g. coordinates or node numbers, used as key for the caches of the class.
+
+        Args:
+            array (ndarray): array to be identified, e.g. coordinates of the nodes, see Grid.get_coordinates_array()
+
+        Returns:
+            tuple: shape, data type and SHA-1 checksum of the array
+        """
+        array = numpy.ascontiguousarray(array)
+
+        return array.shape, array.dtype.str, hashlib.sha1(array.tobytes()).hexdigest()
+
+    def _add_to_cache(self, cache, key, value):
+        """
+        Add an entry to one of the caches of the class. The oldest entry is removed if the cache is full.
+
+        Args:
+            cache (dict): cache of the class
+            key: key of the entry
+            value: value of the entry
+        """
+        if len(cache) >= self._cache_size:
+            del cache[next(iter(cache))]
+
+        cache[key] = value
+
+    def _get_tree(self, coordinates, checksum=None):
+        """
+        Get a KDTree for the given coordinates. The tree is only built if no tree for the same coordinates is found in
+        the cache of the class.
+
+        Args:
+            coordinates (ndarray): coordinates of the nodes, see Grid.get_coordinates_array()
+            checksum (tuple, optional): checksum of the coordinates if already known, see ._checksum()
+
+        Returns:
+            cKDTree
+        """
+        coordinates = numpy.ascontiguousarray(coordinates, dtype=numpy.float32)
+
+        if checksum is None:
+            checksum = self._checksum(coordinates)
+
+        if checksum in self._tree_cache:
+            self.log.debug(f'KDTree for coordinates found in cache')
+            return self._tree_cache[checksum]
+
         self.log.debug(f'set initiate "grid_1_coordinates" as KDTree')
-        tree = KDTree(numpy.float32(grid_1_coordinates))
+        tree = cKDTree(coordinates)
+        self._add_to_cache(self._tree_cache, checksum, tree)
+
+        return tree
+
+    def _get_neighbors(self, coordinates_1, checksum_1, coordinates_2, checksum_2, neighbors_quantity, distance_max):
+        """
+        Search the nearest neighbors of the coordinates of the second grid in the first grid. If a cache_path is set for
+        the instance, the results of a search are stored in a file, named after the checksums of the coordinates and
+        the parameters. A following run of the same simulation loads this file instead of building a KDTree.
+
+        Args:
+            coordinates_1 (ndarray): coordinates of the source grid
+            checksum_1 (tuple): checksum of the coordinates of the source grid, see ._checksum()
+            coordinates_2 (ndarray): coordinates of the target grid
+            checksum_2 (tuple): checksum of the coordinates of the target grid, see ._checksum()
+            neighbors_quantity (int): Number of neighbors to use
+            distance_max (float): maximum distance between node and neighbors
+
+        Returns:
+            tuple: distances and indices of the neighbors, see cKDTree.query()
+        """
+        file = None
+
+        if self.cache_path is not None:
+            key = hashlib.sha1(repr((checksum_1, checksum_2, neighbors_quantity, float(distance_max))).encode())
+            file = self.cache_path / f'nearest_neighbors_{key.hexdigest()}.npz'
+
+            if file.is_file():
+                # Results of a query with only one neighbor are one dimensional
+                shape = (len(coordinates_2), neighbors_quantity) if neighbors_quantity > 1 else (len(coordinates_2),)
+
+                try:
+                    with numpy.load(file) as data:
+                        dist, points = data['dist'], data['points']
+
+                    if dist.shape != shape or points.shape != shape:
+                        raise ValueError(f'Shape {dist.shape} of the stored neighbors does not fit {shape}.')
+
+                    self.log.debug(f'Nearest neighbors loaded from {file}')
+                    return dist, points
+
+                # A damaged file may raise any error while reading (e.g. zipfile.BadZipFile or EOFError), it is
+                # replaced by a new search.
+                except Exception as err:
+                    self.log.warning(f'Nearest neighbors could not be loaded from {file}, search again. {err}')
+
+        tree = self._get_tree(coordinates_1, checksum_1)
+        dist, points = self._query_tree(tree, coordinates_2, neighbors_quantity, distance_max)
+
+        if file is not None:
+            self._save_neighbors(file, dist, points)
+
+        return dist, points
+
+    def _save_neighbors(self, file, dist, points):
+        """
+        Store the results of a nearest neighbor search, see ._get_neighbors(). The file is written under a temporary
+        name and renamed afterwards, so an interrupted or concurrent run never leaves an incomplete file behind. As the
+        file is only a cache, errors are logged but not raised.
+
+        Args:
+            file (Path): file to be written (.npz)
+            dist (ndarray): distances of the neighbors, see cKDTree.query()
+            points (ndarray): indices of the neighbors, see cKDTree.query()
+        """
+        fd, temp_file = tempfile.mkstemp(suffix='.tmp', prefix=f'{file.stem}_', dir=file.parent)
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                numpy.savez(f, dist=dist, points=points)
+
+            os.replace(temp_file, file)
+            self.log.debug(f'Nearest neighbors saved at {file}')
+
+        except OSError as err:
+            self.log.warning(f'Nearest neighbors could not be saved at {file}. {err}')
+
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
 
+    def _query_tree(self, tree, coordinates, neighbors_quantity, distance_max):
+        """
+        Search the nearest neighbors of the given coordinates in a KDTree.
+
+        Args:
+            tree (cKDTree): tree of the source grid
+            coordinates (ndarray): coordinates of the target grid
+            neighbors_quantity (int): Number of neighbors to use
+            distance_max (float): maximum distance between node and neighbors
+
+        Returns:
+            tuple: distances and indices of the neighbors, see cKDTree.query()
+        """
         # Check whether a 32bit oder 64bit version of python is used. If a 32bit version is used, the maximum memory
         # is limited to 4 gb which might be to low. In these cases, the nearest neighbor search will be split up
         # in smaller arrays and merged after.
 
-        if sys.maxsize > 2 ** 32 and 1 == 2:
+        # The queries of the nodes are independent of each other, therefore they are distributed over all available
+        # cores (workers=-1).
+        if sys.maxsize > 2 ** 32:
             self.log.debug(f'tree.query on KDTree(grid_1_coordinates) and grid_2_coordinates')
-            dist, points = tree.query(numpy.float32(grid_2_coordinates), neighbors_quantity, distance_max)
+            dist, points = tree.query(x=coordinates,
+                                      k=neighbors_quantity,
+                                      distance_upper_bound=distance_max,
+                                      workers=-1)
         else:
             # Using a 32 bit version of python. Splitting up in
             splits = 10
-            coordinates_split = numpy.array_split(numpy.float32(grid_2_coordinates), splits)
+            coordinates_split = numpy.array_split(coordinates, splits)
 
             dist = []
             points = []
@@ -197,69 +760,19 @@ class GridTransformer:
             for arr in coordinates_split:
                 i += 1
 
-                self.log.debug(f'tree.query on KDTree(grid_1_coordinates) and grid_2_coordinates [{i}/{splits}]')
-                dist_tmp, points_tmp = tree.query(x=numpy.float32(arr),
+                self.log.debug('tree.query on KDTree(grid_1_coordinates) and grid_2_coordinates [%s/%s]', i, splits)
+                dist_tmp, points_tmp = tree.query(x=arr,
                                                   k=neighbors_quantity,
-                                                  distance_upper_bound=distance_max)
-                # dist.append(dist_tmp)
-                # points.append(points_tmp)
-                if i == 1:
-                    points = points_tmp
-                    dist = dist_tmp
-                else:
-                    points = numpy.concatenate((points, points_tmp), axis=0)
-                    dist = numpy.concatenate((dist, dist_tmp), axis=0)
-
-        transform_dict = {}
-        count_lonely_nodes = 0
-
-        # Iterate through the results to put them into a dictionary. Additionally the maximum distance will be
-        # checked.
-        self.log.debug(f'Check results from .query and save in dictionary')
-        for i in range(len(dist)):
-            # Initialize the dictionary entry for a node
-            transform_dict[grid_2_nodes[i]] = []
-
-            # Loop through all neighbors and check distance
-            # Distinguish between only one neighbor and a couple of neighbors.
-            if not len(dist.shape) == 1:  # Only one neighbor has been taken into account
-                for k in range(len(dist[i])):
-                    node = grid_1_nodes[points[i][k]-1]
-                    distance = dist[i][k]
-
-                    # Easily just continue when the maximum distance is exceeded
-                    if distance_max != numpy.inf:
-                        if distance > distance_max:
-                            continue
-
-                    # Append node and distance to list in dictionary
-                    transform_dict[grid_2_nodes[i]].append({'node_number': node, 'distance': distance})
-            else:  # A couple of neighbors have been taken into account
-                node = grid_1_nodes[points[i] - 1]
-                distance = dist[i]
-
-                # Easily just continue when the maximum distance is exceeded
-                if distance_max != numpy.inf:
-                    if distance > distance_max:
-                        continue
-
-                # Append node and distance to list in dictionary
-                transform_dict[grid_2_nodes[i]].append({'node_number': node, 'distance': distance})
-
-            # Check if at least one neighbor was found according to the maximum distance. Otherwise exit method and
-            # and log an error.
-            if len(transform_dict[grid_2_nodes[i]]) == 0:
-                self.log.debug(f'No neighbor found for node {grid_2_nodes[i]} in {grid_name_2}')
-                count_lonely_nodes += 1
-                transform_dict[grid_2_nodes[i]] = None
+                                                  distance_upper_bound=distance_max,
+                                                  workers=-1)
+                dist.append(dist_tmp)
+                points.append(points_tmp)
 
-        if count_lonely_nodes > 0:
-            self.log.warning(f'No neighbors found for {count_lonely_nodes} nodes in {grid_name_1} for {grid_name_2} in '
-                             f'a range of {distance_max}.')
-        self.grids[grid_name_2]['transform'][grid_name_1] = transform_dict
-        self.log.info(f'Nearest neighbors in {grid_name_1} found for {grid_name_2}')
+            # The results of the splits are merged once at the end
+            points = numpy.concatenate(points, axis=0)
+            dist = numpy.concatenate(dist, axis=0)
 
-        return True
+        return dist, points
 
     def transition(self, src_grid_name, value_name, target_grid_name):
         """
@@ -293,51 +806,50 @@ class GridTransformer:
         # Check if value exists in src_grid
         src_grid = self.grids[src_grid_name]
         target_grid = self.grids[target_grid_name]
-        if not src_grid['grid'].get_node_values(value_name):
+        try:
+            src_values = src_grid['grid'].get_value_array(value_name)
+        except KeyError:
             raise KeyError(f'Value_name ({value_name}) not found in nodes.')
 
-        src_values = src_grid['grid'].get_node_values(value_name)
-
         # Check if neighbors for this combination have been set
-        if src_grid_name not in target_grid['transform']:
+        if src_grid_name not in target_grid['transform'] or src_grid_name not in target_grid['weights']:
             raise KeyError(f'No transformation matrix has been found for {src_grid_name} to {target_grid_name}. '
                            f'Before transformation neighbors have to be found.')
 
-        for node, node_dict in target_grid['transform'][src_grid_name].items():
-            sum_distance = 0
-            factor = 0
-
-            if node_dict:
-                # Calculating of the weighted average
-                # Take into account if a value has the distance of 0. In this case this particular value should be
-                # used instead of creating a weighted average.
-                result = None
-
-                for item in node_dict:
-                    distance = item['distance']
-                    node_number = item['node_number']
-                    value = src_values[node_number]
-
-                    # Check if the actual node has distance of 0. If so set value as final result and stop looping.
-                    # sum_distance will be set to zero to show, that a perfect fitting node has been found.
-                    if distance == 0:
-                        result = value
-                        sum_distance = 0
-                        break
-                    else:
-                        sum_distance += 1 / distance
-                        factor += value * 1 / distance
+        transform_dict = target_grid['transform'][src_grid_name]
 
-                # sum_distance is 0 when a perfect match has been found for the specific node
-                if not sum_distance == 0:
-                    result = factor / sum_distance
+        weights = target_grid['weights'][src_grid_name]
 
-                target_grid['grid'].nodes[node].set_value(value_name, result)
-            else:
-                target_grid['grid'].nodes[node].set_value(value_name, numpy.nan)
+        # The neighbor indices refer to the order of the source nodes, which is the order of the nodes in the grid.
+        # Nodes without a numeric value are taken into account as NaN. Only if the source grid has been changed since
+        # the neighbors have been found, the values are collected node by node.
+        if len(src_values) == len(weights['source_nodes']):
+            values = src_values
+        else:
+            src_values = dict(zip(src_grid['grid'].nodes.keys(), src_values.tolist()))
+            values = numpy.fromiter((src_values.get(node, numpy.nan) for node in weights['source_nodes']),
+                                    dtype=float, count=len(weights['source_nodes']))
+
+        # The weighted average of all nodes is computed at once by a sparse matrix product. Neighbors with the weight 0
+        # are not part of the matrix, so they do not spread NaN values. Nodes without neighbors get NaN as result.
+        matrix, lonely = self._get_weights_matrix(weights)
 
-        # Check if a value is set for all nodes
-        target_grid['grid'].check_value_set_completeness(value_name)
+        results = matrix @ values
+        results[lonely] = numpy.nan
+
+        target_nodes = target_grid['grid'].nodes
+
+        target_grid['grid'].set_value_array(value_name, results, transform_dict.keys())
+
+        # Nodes without neighbors already got NaN from the results array. Only nodes missing in the transformation
+        # matrix still need a value, therefore the grid is not scanned again node by node.
+        missing_nodes = target_nodes.keys() - transform_dict.keys()
+
+        for node in missing_nodes:
+            target_nodes[node].set_value(value_name, numpy.nan)
+
+        if missing_nodes:
+            self.log.debug(f'Added NaN value for {len(missing_nodes)} nodes without transformation.')
 
         self.log.info(f'Transition for {value_name} from {src_grid_name} to {target_grid_name} successful')
         return True
@@ -381,21 +893,22 @@ class GridTransformer:
             else:
                 count_lonely_nodes += 1
 
+            # The distances are found by the KDTree and can not be NaN, therefore no NaN aware reductions are needed
             distances = numpy.array(distances)
 
             self.log.info(f'Neighborhood to: {grid}')
-            self.log.info(f'\t Number of neighbors in total: {len(distances)}')
-            self.log.info(f'\t Mean: {numpy.nanmean(distances)}')
-            self.log.info(f'\t Std. Deviation: {numpy.nanstd(distances)}')
-            self.log.info(f'\t Min: {numpy.ndarray.min(distances)}')
-            self.log.info(f'\t Max: {numpy.ndarray.max(distances)}')
+            self.log.info(f'\t Number of neighbors in total: {distances.size}')
+            self.log.info(f'\t Mean: {distances.mean()}')
+            self.log.info(f'\t Std. Deviation: {distances.std()}')
+            self.log.info(f'\t Min: {distances.min()}')
+            self.log.info(f'\t Max: {distances.max()}')
             self.log.info(f'\t Lonely: {count_lonely_nodes}')
 
         self.log.info(f'End of Statistics')
 
         return True
 
-    def transformation_validation(self, src_grid_name, value_name, target_grid_name):
+    def transformation_validation(self, src_grid_name, value_name, target_grid_name, plot: bool = True):
         """ Validating the method of transferring data from one grid to another. There are two different grids (one is
         maybe coarser then the other). The information within the grid is transferred from one grid to the other and
         backwards. The transformation form a (e.g. finer) to b (e.g. coarser) includes data loss. The amount of loss
@@ -403,12 +916,14 @@ class GridTransformer:
         source grid (src_grid_name) to the target grid (target_grid_name) and back to the source grid.
         The data loss will be shown by checking the difference 'source - source_re'. As a result one
         get a min/max-value, mean and standard deviation to check whether the data loss is acceptable. In addition
-        a plot is created to be able to make a visual check.
+        a plot can be created to be able to make a visual check. If the nearest neighbors have not been searched for one of
+        the directions yet, this is done with the default parameters of .find_nearest_neighbors().
 
         Parameters:
             src_grid_name (str): name of source grid
             target_grid_name (str): name of target grid
             value_name (str): name of values in source grid
+            plot (bool, optional): if true the data sets are plotted for a visual check (default: True)
 
         Returns:
             None
@@ -420,19 +935,28 @@ class GridTransformer:
             raise TypeError(f'Input parameter value_name must be of type string, is {type(value_name)}.')
         if not isinstance(target_grid_name, str):
             raise TypeError(f'Input parameter target_grid_name must be of type string, is {type(target_grid_name)}.')
+        if not isinstance(plot, bool):
+            raise TypeError(f'Input parameter plot must be of type boolean, is {type(plot)}.')
 
         try:
+            # The transformation is done in both directions. Missing neighborhoods are searched with the default
+            # parameters of .find_nearest_neighbors(), the KDTrees of both grids are taken from the cache if available.
+            if src_grid_name not in self.grids[target_grid_name]['transform']:
+                self.find_nearest_neighbors(src_grid_name, target_grid_name)
+            if target_grid_name not in self.grids[src_grid_name]['transform']:
+                self.find_nearest_neighbors(target_grid_name, src_grid_name)
+
             # Data transformation from input_mesh to output_mesh
             # output = mesh_transformation(input_mesh, output_mesh, input_data)
             src_grid_begin = self.grids[src_grid_name]['grid']
-            data_begin = numpy.array(list(src_grid_begin.get_node_values(value_name).values()))
+            data_begin = src_grid_begin.get_value_array(value_name)
             target_grid = self.grids[target_grid_name]['grid']
 
             self.transition(src_grid_name, value_name, target_grid_name)
             self.transition(target_grid_name, value_name, src_grid_name)
 
             src_grid_end = self.grids[src_grid_name]['grid']
-            data_end = numpy.array(list(src_grid_end.get_node_values(value_name).values()))
+            data_end = src_grid_end.get_value_array(value_name)
 
             self.log.info('Array output: input after retransformation')
 
@@ -444,13 +968,20 @@ class GridTransformer:
             self.log.info(f'Source Grid: {src_grid_begin}')
             self.log.info(f'Target Grid: {target_grid}')
             self.log.info(f'After transformation:')
-            self.log.info(f'NaN-Values: {sum(numpy.isnan(data_end))}')
-            self.log.info(f'Mean: {numpy.nanmean(diff)}')
-            self.log.info(f'Std. Deviation: {numpy.nanstd(diff)}')
-            self.log.info(f'Mean Match: {numpy.nanmean(numpy.absolute(data_end / data_begin))}')
-            self.log.info(f'Std. Deviation: {numpy.nanstd(numpy.absolute(data_end / data_begin))}')
-            self.log.info(f'Worst Match: {numpy.ndarray.max(numpy.absolute(data_end / data_begin))}')
-            self.log.info(f'Worst Match: {numpy.ndarray.min(numpy.absolute(data_end / data_begin))}')
+            # The ratio of the data sets is computed once and used for all statistics of the match
+            match = numpy.absolute(data_end / data_begin)
+
+            # NaN values are removed once per data set, instead of being searched by every nanmean() and nanstd()
+            diff_valid = diff[~numpy.isnan(diff)]
+            match_valid = match[~numpy.isnan(match)]
+
+            self.log.info(f'NaN-Values: {numpy.count_nonzero(numpy.isnan(data_end))}')
+            self.log.info(f'Mean: {diff_valid.mean()}')
+            self.log.info(f'Std. Deviation: {diff_valid.std()}')
+            self.log.info(f'Mean Match: {match_valid.mean()}')
+            self.log.info(f'Std. Deviation: {match_valid.std()}')
+            self.log.info(f'Worst Match: {match.max()}')
+            self.log.info(f'Worst Match: {match.min()}')
 
             # # Generating the visual output
             # self.log.info('Plotting 2d data sets to visually comparison')
@@ -479,38 +1010,41 @@ class GridTransformer:
             # # function to show the plot
             # plt.show()
             # #########################################################################################
-            # Generating the visual output
-            self.log.info('Plotting 3d data sets to visually comparison')
-            mpl_fig = plt.figure()
-            ax1 = mpl_fig.add_subplot(221)
-            cb1 = ax1.scatter(list(src_grid_begin.get_node_values('x_coordinate').values()),
-                              list(src_grid_begin.get_node_values('y_coordinate').values()),
-                              list(src_grid_begin.get_node_values('z_coordinate').values()),
-                              # s=1, c=data_begin, cmap=plt.cm.get_cmap('RdBu'))
-                              c=data_begin, cmap=plt.cm.get_cmap('RdBu'))
-            plt.colorbar(cb1, ax=ax1)
-            ax1.set_title('input (original)')
-            ax2 = mpl_fig.add_subplot(222)
-            cb2 = ax2.scatter(list(target_grid.get_node_values('x_coordinate').values()),
-                              list(target_grid.get_node_values('y_coordinate').values()),
-                              list(target_grid.get_node_values('z_coordinate').values()),
-                              # s=1, c=list(target_grid.get_node_values(value_name).values()),
-                              c=list(target_grid.get_node_values(value_name).values()),
-                              cmap=plt.cm.get_cmap('RdBu'))
-            plt.colorbar(cb2, ax=ax2)
-            ax2.set_title('output')
-
-            ax3 = mpl_fig.add_subplot(223)
-            cb3 = ax3.scatter(list(src_grid_end.get_node_values('x_coordinate').values()),
-                              list(src_grid_end.get_node_values('y_coordinate').values()),
-                              list(src_grid_end.get_node_values('z_coordinate').values()),
-                              # s=1, c=data_end, cmap=plt.cm.get_cmap('RdBu'))
-                              c=data_end, cmap=plt.cm.get_cmap('RdBu'))
-            plt.colorbar(cb3, ax=ax3)
-            ax3.set_title('input (retransformation)')
-
-            # function to show the plot
-            plt.show()
+            # Generating the visual output. matplotlib is only imported if a plot is requested.
+            if plot:
+                import matplotlib.pyplot as plt  # visualisation of transformation validation
+
+                self.log.info('Plotting 3d data sets to visually comparison')
+                mpl_fig = plt.figure()
+                ax1 = mpl_fig.add_subplot(221)
+                cb1 = ax1.scatter(list(src_grid_begin.get_node_values('x_coordinate').values()),
+                                  list(src_grid_begin.get_node_values('y_coordinate').values()),
+                                  list(src_grid_begin.get_node_values('z_coordinate').values()),
+                                  # s=1, c=data_begin, cmap='RdBu')
+                                  c=data_begin, cmap='RdBu')
+                plt.colorbar(cb1, ax=ax1)
+                ax1.set_title('input (original)')
+                ax2 = mpl_fig.add_subplot(222)
+                cb2 = ax2.scatter(list(target_grid.get_node_values('x_coordinate').values()),
+                                  list(target_grid.get_node_values('y_coordinate').values()),
+                                  list(target_grid.get_node_values('z_coordinate').values()),
+                                  # s=1, c=list(target_grid.get_node_values(value_name).values()),
+                                  c=list(target_grid.get_node_values(value_name).values()),
+                                  cmap='RdBu')
+                plt.colorbar(cb2, ax=ax2)
+                ax2.set_title('output')
+
+                ax3 = mpl_fig.add_subplot(223)
+                cb3 = ax3.scatter(list(src_grid_end.get_node_values('x_coordinate').values()),
+                                  list(src_grid_end.get_node_values('y_coordinate').values()),
+                                  list(src_grid_end.get_node_values('z_coordinate').values()),
+                                  # s=1, c=data_end, cmap='RdBu')
+                                  c=data_end, cmap='RdBu')
+                plt.colorbar(cb3, ax=ax3)
+                ax3.set_title('input (retransformation)')
+
+                # function to show the plot
+                plt.show()
 
             return True
 
@@ -14,8 +14,12 @@ class Node:
             values (dict, optional): dictionary of values
     """
 
+    # A grid consists of a lot of nodes. Therefore the attributes are stored in slots instead of a dictionary per node
+    # and all nodes share one logger.
+    __slots__ = ('node_number', 'x_coordinate', 'y_coordinate', 'z_coordinate', 'values')
+    log = log.getLogger('Node')
+
     def __init__(self, node_number, x_coordinate, y_coordinate, z_coordinate=None, values=None):
-        self.log = log.getLogger(self.__class__.__name__)
 
         # Check input parameters
         if not isinstance(node_number, int):
@@ -43,6 +47,23 @@ class Node:
     def __str__(self):
         return f'{self.__class__.__name__}: no={self.node_number}, coordinates={self.coordinates}, values={self.values}'
 
+    def copy(self):
+        """
+        Returns a copy of the node. Coordinates and values are numbers, which cannot be changed in place. Therefore only
+        the dictionary of values is copied and not each value like copy.deepcopy() does.
+
+        Returns: copy of the node
+
+        """
+        node = Node.__new__(Node)
+        node.node_number = self.node_number
+        node.x_coordinate = self.x_coordinate
+        node.y_coordinate = self.y_coordinate
+        node.z_coordinate = self.z_coordinate
+        node.values = self.values.copy()
+
+        return node
+
     @property
     def coordinates(self):
         """
@@ -1,8 +1,5 @@
-import random
-import statistics
 import numpy
 import logging as log
-import matplotlib.pyplot as plt  # used for visualisation of transformation validation
 
 
 class GaussRandomizeGrid:
@@ -11,30 +8,37 @@ class GaussRandomizeGrid:
     def __init__(self):
 
         self.log = log.getLogger(self.__class__.__name__)
+        self.rng = numpy.random.default_rng()
 
-    def random_numbers_range(self, min_val, max_val, sigma_percentage=0.05):
+    def random_numbers_range(self, min_val, max_val, sigma_percentage=0.05, size=None):
         """ Function generating an random number in a given range of min_val and max_val. Distribution is more or less
             gaussian. When a generated random number is below min_val, min_val will be returned, if the number is above
-            max_val, max_val will be returned.
+            max_val, max_val will be returned. If size is given, an array of random numbers is generated at once.
 
          Parameters:
             min_val (float): upper boundary of random number range
             max_val (float): lower boundary of random number range
             sigma_percentage (float, optional), optional: sets the percentage of mean to be used as sigma.
             Has to be between 0 and 1.
+            size (int, optional): number of random numbers to be generated
 
         Returns:
-            double
+            double or numpy.array if size is given
         """
 
         try:
             mu_val = (min_val+max_val)/2
-            # If sigma_val is 0, the result of random.gauss equals mu_val. Therefore it will be added 0.01.
+            # If sigma_val is 0, the result of the normal distribution equals mu_val. Therefore it will be added 0.01.
             sigma_val = mu_val * sigma_percentage + 0.01
 
-            # Generating the random number
-            random_number = min(max_val, max(min_val, random.gauss(mu_val, sigma_val)))
-            return random_number
+            # Generating the random numbers, all of them with one call
+            random_numbers = self.rng.normal(mu_val, sigma_val, size)
+
+            if size is None:
+                return min(max_val, max(min_val, random_numbers))
+
+            # The array of random numbers is clipped in place, no further array is allocated.
+            return numpy.clip(random_numbers, min_val, max_val, out=random_numbers)
 
         except Exception as err:
             self.log.error(f'An error occurred {err}')
@@ -68,30 +72,33 @@ class GaussRandomizeGrid:
             data_set = list(input_data.values())
             keys = list(input_data.keys())
         elif isinstance(input_data, list):
-            if len(input_data[0] == 1):
-                data_set = input_data
-            else:
-                raise TypeError('Input_data has to be of type dict or list(1-dimensional)')
+            data_set = input_data
         else:
             raise TypeError('Input_data has to be of type dict or list(1-dimensional)')
 
-        # Statistics of given data set
-        min_val = min(data_set)
-        max_val = max(data_set)
-        mean_val = statistics.mean(data_set)
-        stddev_val = statistics.stdev(data_set)
+        # The data set is converted once into a contiguous float array, which is used for all following operations
+        data_array = numpy.ascontiguousarray(data_set, dtype=numpy.float64)
+
+        if data_array.ndim != 1:
+            raise TypeError('Input_data has to be of type dict or list(1-dimensional)')
+
+        # Statistics of given data set, computed by numpy reductions instead of python loops
+        min_val = float(data_array.min())
+        max_val = float(data_array.max())
+        mean_val = float(data_array.mean())
+        stddev_val = float(data_array.std(ddof=1))
         # coeff_of_var_val will be used as input for the range of random numbers. To create correct random numbers a
         # value unlike zero is mandatory
         coeff_of_var_val = stddev_val / mean_val
         if coeff_of_var_val == 0:
             coeff_of_var_val += 0.01
 
-        self.log.debug(f'Statistics of input:')
-        self.log.debug(f'Minimum: {min_val}')
-        self.log.debug(f'Maximum: {max_val}')
-        self.log.debug(f'Mean: {mean_val}')
-        self.log.debug(f'Standard deviation: {stddev_val}')
-        self.log.debug(f'Coefficient of variation: {coeff_of_var_val}')
+        self.log.debug('Statistics of input:')
+        self.log.debug('Minimum: %s', min_val)
+        self.log.debug('Maximum: %s', max_val)
+        self.log.debug('Mean: %s', mean_val)
+        self.log.debug('Standard deviation: %s', stddev_val)
+        self.log.debug('Coefficient of variation: %s', coeff_of_var_val)
 
         # Influencing the statistics of the given data set depending on the given maximum percentage of deviation
         min_val_off = 1
@@ -101,51 +108,48 @@ class GaussRandomizeGrid:
         if min_val_off > max_val_off:
             min_val_off, max_val_off = max_val_off, min_val_off
 
-        # Creating an empty numpy.array of the same size and type as given input data set. Float type is mandatory as
-        # self.random_numbers_range (input in numpy.array) is always between 0 and 1.
-        rand_array = numpy.empty_like(data_set).astype(float)
-
-        # Filling the random array with random numbers
-        with numpy.nditer(rand_array, op_flags=['readwrite']) as it:
-            for x in it:
-                random_no = self.random_numbers_range(min_val_off, max_val_off, coeff_of_var_val)
-                x[...] = random_no
-
-        rand_array = numpy.multiply(rand_array, data_set)
-
-        # Statistics of given data set
-        min_val_rand = min(rand_array)
-        max_val_rand = max(rand_array)
-        mean_val_rand = statistics.mean(rand_array)
-        stddev_val_rand = statistics.stdev(rand_array)
-        # coeff_of_var_val_rand will be used as input for the range of random numbers
-        coeff_of_var_val_rand = stddev_val_rand/mean_val_rand
-
-        self.log.debug('Statistics of output:')
-        self.log.debug(f'Minimum: {min_val_rand}')
-        self.log.debug(f'Maximum: {max_val_rand}')
-        self.log.debug(f'Mean: {mean_val_rand}')
-        self.log.debug(f'Standard deviation: {stddev_val_rand}')
-        self.log.debug(f'Coefficient of variation: {coeff_of_var_val_rand}')
-
-        # printing output for debugging purposes
-        if plot:
-            fig = plt.figure()
-            sub1 = fig.add_subplot(121)
-            sub1.hist(data_set, bins='auto', range=(min_val, max_val))
-            sub1.set_title('Histogram input data set')
-
-            sub2 = fig.add_subplot(122)
-            sub2.hist(rand_array, bins='auto', range=(min_val_rand, max_val_rand))
-            sub2.set_title('Histogram random numbers')
-            plt.show()
+        # Creating a numpy.array of the same size as the given input data set filled with random numbers. All random
+        # numbers are generated at once.
+        rand_array = self.random_numbers_range(min_val_off, max_val_off, coeff_of_var_val, size=data_array.shape)
+
+        # The offsets are applied to the data set in place, no further array is allocated
+        numpy.multiply(rand_array, data_array, out=rand_array)
+
+        # Statistics of the output are only needed for the log on debug level and the plot. Otherwise the reductions
+        # over the whole output are skipped.
+        if plot or self.log.isEnabledFor(log.DEBUG):
+            # Statistics of output data set
+            min_val_rand = float(rand_array.min())
+            max_val_rand = float(rand_array.max())
+            mean_val_rand = float(rand_array.mean())
+            stddev_val_rand = float(rand_array.std(ddof=1))
+            # coeff_of_var_val_rand will be used as input for the range of random numbers
+            coeff_of_var_val_rand = stddev_val_rand/mean_val_rand
+
+            self.log.debug('Statistics of output:')
+            self.log.debug('Minimum: %s', min_val_rand)
+            self.log.debug('Maximum: %s', max_val_rand)
+            self.log.debug('Mean: %s', mean_val_rand)
+            self.log.debug('Standard deviation: %s', stddev_val_rand)
+            self.log.debug('Coefficient of variation: %s', coeff_of_var_val_rand)
+
+            # printing output for debugging purposes. matplotlib is only imported if a plot is requested.
+            if plot:
+                import matplotlib.pyplot as plt  # used for visualisation of the histograms
+
+                fig = plt.figure()
+                sub1 = fig.add_subplot(121)
+                sub1.hist(data_array, bins='auto', range=(min_val, max_val))
+                sub1.set_title('Histogram input data set')
+
+                sub2 = fig.add_subplot(122)
+                sub2.hist(rand_array, bins='auto', range=(min_val_rand, max_val_rand))
+                sub2.set_title('Histogram random numbers')
+                plt.show()
 
         if isinstance(input_data, dict):
-            output_data = {}
-
             if len(rand_array) == len(keys):
-                for i in range(len(rand_array)):
-                    output_data[keys[i]] = rand_array[i]
+                output_data = dict(zip(keys, rand_array.tolist()))
 
             else:
                 raise ValueError(f'Dimensions of randomized data len(rand_array)={len(rand_array)} and dictionary '
@@ -191,21 +191,16 @@ class SimulationHandler:
             if not path.is_dir():
                 # Path does not exist
                 if create_missing:
-                    if path.mkdir():
+                    # Path.mkdir() returns None, success is checked by the existence of the folder
+                    path.mkdir()
+
+                    if path.is_dir():
                         self.log.debug(f'Path generated successfully. ({path})')
                         self.paths[path_name] = path
                         self.log.info(f'Checked and added path. ({path})')
                         return True
-
                     else:
-                        # Another try
-                        if path.mkdir():
-                            self.log.debug(f'Path generated successfully. ({path})')
-                            self.paths[path_name] = path
-                            self.log.info(f'Checked and added path. ({path})')
-                            return True
-                        else:
-                            raise PermissionError(f'Not able to create path. ({path})')
+                        raise PermissionError(f'Not able to create path. ({path})')
                 else:
                     raise NotADirectoryError(f'Path {path} does not exist. If you want to create the path '
                                              f'automatically use the create_missing=True (default) option.')
@@ -244,6 +239,7 @@ class SimulationHandler:
 
         input_sub_folder = 'input'
         output_sub_folder = 'output'
+        root_path = Path(root_path)
 
         if self.set_path('root', root_path, create_missing, False):
             self.log.debug(f'Root path set for simulation {self.name} to {self.get_root_path()}')
@@ -264,14 +260,15 @@ class SimulationHandler:
     def set_input_path(self, path, create_missing=True):
         return self.set_path('input', path, create_missing, False)
 
+    # The paths are stored as Path objects by .set_path(), therefore they are returned without creating new objects
     def get_root_path(self):
-        return Path(self.paths['root'])
+        return self.paths['root']
 
     def get_input_path(self):
-        return Path(self.paths['input'])
+        return self.paths['input']
 
     def get_output_path(self):
-        return Path(self.paths['output'])
+        return self.paths['output']
 
     def output_path_cleanup(self, recreate_missing=True):
         """
@@ -312,8 +309,10 @@ class SimulationHandler:
         return True
 
     def call_subprocess(self, batch_file, cwd_folder):
-        """ Calling in the engines created batch files to run the simulations. The batch files will be ran in the
-         shell and the progress can be followed up at the run-terminal of python, but is not stored in the log file.
+        """ Calling in the engines created batch files to run the simulations. The batch files are started directly,
+         without an additional shell. The output of the simulation is read line by line while it is running and
+         forwarded to the log, so the progress can be followed up at the run-terminal of python and is stored in the
+         log file as well.
 
         Args:
             batch_file (str/path): path to the batch-file as Path or String as absolute path
@@ -335,7 +334,16 @@ class SimulationHandler:
         if batch_file.is_file() and folder.is_dir():
             self.log.info(f'Start subprocess in {batch_file} executed in {cwd_folder}')
 
-            subprocess.call(str(batch_file), shell=True, cwd=str(cwd_folder))  # Start simulation in shell
+            # Start simulation. The batch file is started directly without an additional shell, so the path is not
+            # tokenized again (Windows starts .bat files by CreateProcess, on Unix the file must be executable). The
+            # output is drained continuously, so the pipe can not fill up and block the simulation.
+            with subprocess.Popen([str(batch_file)], shell=False, cwd=str(cwd_folder), stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True, errors='replace', bufsize=1) as process:
+                for line in process.stdout:
+                    self.log.info('[subprocess] %s', line.rstrip())
+
+            if process.returncode:
+                self.log.warning(f'Subprocess ended with return code {process.returncode}')
 
             self.log.debug('End of subprocess')
 